@@ -0,0 +1,26 @@
+'''Measure the memory used by an instance of Color.
+
+Run from the top directory of the repository:
+
+    PYTHONPATH=. python benchmarks/bench_color_memory.py
+'''
+
+import tracemalloc
+
+from color_contrast_calc.color import Color
+
+
+rgbs = [(r, g, b) for r in range(0, 256, 4)
+        for g in range(0, 256, 4) for b in range(0, 256, 16)]
+
+tracemalloc.start()
+before = tracemalloc.take_snapshot()
+colors = [Color(rgb) for rgb in rgbs]
+for color in colors:
+    color.hsl, color.rgb_code
+after = tracemalloc.take_snapshot()
+tracemalloc.stop()
+
+total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+print('{:d} colors: {:.1f} bytes per instance'.format(len(colors),
+                                                      total / len(colors)))
@@ -0,0 +1,29 @@
+'''Measure the per-call savings of caching the matrices of the
+hue_rotate, saturate and grayscale converters.
+
+Run from the top directory of the repository:
+
+    PYTHONPATH=. python benchmarks/bench_converter_matrices.py
+'''
+
+import timeit
+
+from color_contrast_calc.converters import grayscale
+from color_contrast_calc.converters import hue_rotate
+from color_contrast_calc.converters import saturate
+
+
+number = 20000
+cases = [
+    ('hue_rotate', hue_rotate._calc_coefficients, 30),
+    ('saturate', saturate._calc_coefficients, 80),
+    ('grayscale', grayscale._calc_coefficients, 50),
+]
+
+for (name, calc_matrix, ratio) in cases:
+    uncached = timeit.timeit(lambda: calc_matrix.__wrapped__(ratio),
+                             number=number)
+    cached = timeit.timeit(lambda: calc_matrix(ratio), number=number)
+
+    print('{:10s} built: {:6.2f} usec  cached: {:6.2f} usec'.format(
+        name, uncached / number * 1e6, cached / number * 1e6))
@@ -0,0 +1,31 @@
+'''Measure the time taken by ``import color_contrast_calc``.
+
+The cumulative import time reported by ``python -X importtime`` is
+taken as the median of several runs in fresh interpreters.
+
+Run from the top directory of the repository:
+
+    PYTHONPATH=. python benchmarks/bench_import_time.py
+'''
+
+import statistics
+import subprocess
+import sys
+
+
+def import_time(module):
+    command = [sys.executable, '-X', 'importtime', '-c', 'import ' + module]
+    result = subprocess.run(command, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+
+    for line in result.stderr.splitlines():
+        fields = [f.strip() for f in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+
+    return None
+
+
+times = [import_time('color_contrast_calc') for _ in range(15)]
+print('import color_contrast_calc: {:.1f} msec (median of {:d} runs)'.format(
+    statistics.median(times) / 1000, len(times)))
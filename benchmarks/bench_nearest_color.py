@@ -0,0 +1,35 @@
+'''Compare palette.nearest_color() and nearest_color_indexes() with a
+linear scan over NAMED_COLORS.
+
+Run from the top directory of the repository:
+
+    PYTHONPATH=. python benchmarks/bench_nearest_color.py
+'''
+
+import random
+import time
+
+from color_contrast_calc.color import NAMED_COLORS
+from color_contrast_calc import palette
+
+
+def linear_scan(rgb):
+    return min(NAMED_COLORS,
+               key=lambda c: sum((a - b) ** 2 for (a, b) in zip(rgb, c.rgb)))
+
+
+random.seed(0)
+rgbs = [tuple(random.randrange(256) for _ in range(3)) for _ in range(20000)]
+palette.nearest_color(rgbs[0])
+
+cases = [
+    ('linear scan', lambda: [linear_scan(rgb) for rgb in rgbs]),
+    ('nearest_color', lambda: [palette.nearest_color(rgb) for rgb in rgbs]),
+    ('nearest_color_indexes', lambda: palette.nearest_color_indexes(rgbs)),
+]
+
+for (name, run) in cases:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print('{:22s} {:8.2f} usec/color'.format(name, elapsed / len(rgbs) * 1e6))
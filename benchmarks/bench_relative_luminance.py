@@ -0,0 +1,37 @@
+'''Compare the table lookup of checker.relative_luminance with the
+direct calculation of the tristimulus values.
+
+Run from the top directory of the repository:
+
+    PYTHONPATH=. python benchmarks/bench_relative_luminance.py
+'''
+
+import timeit
+
+from color_contrast_calc import checker
+
+
+def relative_luminance_without_table(rgb):
+    (r, g, b) = (checker._tristimulus_value(c) for c in rgb)
+    return r * 0.2126 + g * 0.7152 + b * 0.0722
+
+
+rgbs = [(r, g, b) for r in range(0, 256, 15)
+        for g in range(0, 256, 15) for b in range(0, 256, 15)]
+
+
+def run(func):
+    for rgb in rgbs:
+        func(rgb)
+
+
+number = 20
+computed = timeit.timeit(lambda: run(relative_luminance_without_table),
+                         number=number)
+looked_up = timeit.timeit(lambda: run(checker.relative_luminance),
+                          number=number)
+calls = number * len(rgbs)
+
+print('calculated:  {:.3f} usec per call'.format(computed / calls * 1e6))
+print('looked up:   {:.3f} usec per call'.format(looked_up / calls * 1e6))
+print('speedup:     {:.2f}x'.format(computed / looked_up))
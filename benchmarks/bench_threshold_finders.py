@@ -0,0 +1,40 @@
+'''Compare the scalar threshold finders with their batch versions.
+
+Run from the top directory of the repository:
+
+    PYTHONPATH=. python benchmarks/bench_threshold_finders.py
+'''
+
+import random
+import time
+
+from color_contrast_calc.threshold_finders import brightness
+from color_contrast_calc.threshold_finders import lightness
+
+
+random.seed(0)
+size = 20000
+fixed_rgbs = [tuple(random.randrange(256) for _ in range(3))
+              for _ in range(size)]
+other_rgbs = [tuple(random.randrange(256) for _ in range(3))
+              for _ in range(size)]
+
+cases = [
+    ('brightness.find', lambda: [brightness.find(f, o) for (f, o)
+                                 in zip(fixed_rgbs, other_rgbs)]),
+    ('brightness.find_analytic',
+     lambda: [brightness.find_analytic(f, o) for (f, o)
+              in zip(fixed_rgbs, other_rgbs)]),
+    ('brightness.find_many',
+     lambda: brightness.find_many(fixed_rgbs, other_rgbs)),
+    ('lightness.find', lambda: [lightness.find(f, o) for (f, o)
+                                in zip(fixed_rgbs, other_rgbs)]),
+    ('lightness.find_many',
+     lambda: lightness.find_many(fixed_rgbs, other_rgbs)),
+]
+
+for (name, run) in cases:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print('{:25s} {:8.2f} usec/pair'.format(name, elapsed / size * 1e6))
@@ -1,7 +1,7 @@
 from . import utils
 from .color import Color
 from .color import NAME_TO_COLOR as _NAME_TO_COLOR
-from .color import HEX_TO_COLOR as _HEX_TO_COLOR
+from .color import _shared_color
 
 class InvalidColorRepresentationError(Exception):
     '''Error raised if creating a Color instance with invalid value.
@@ -52,10 +52,7 @@ def _color_from_rgb(rgb_value, name=None):
 
     hex_code = utils.rgb_to_hex(rgb_value)
 
-    if not name and hex_code in _HEX_TO_COLOR:
-        return _HEX_TO_COLOR[hex_code]
-
-    return Color(rgb_value, name)
+    return _shared_color(hex_code, name) or Color(rgb_value, name)
 
 
 def _color_from_str(color_value, name=None):
@@ -69,7 +66,4 @@ def _color_from_str(color_value, name=None):
 
     hex_code = utils.normalize_hex(color_value)
 
-    if not name and hex_code in _HEX_TO_COLOR:
-        return _HEX_TO_COLOR[hex_code]
-
-    return Color(hex_code, name)
+    return _shared_color(hex_code, name) or Color(hex_code, name)
@@ -0,0 +1,24 @@
+'''Provide ``np``, a stand-in for the numpy module that imports NumPy
+when one of its attributes is used for the first time.
+
+NumPy is needed only by the functions that work on arrays, and
+importing it takes longer than importing the rest of this package.
+'''
+
+import importlib
+
+
+class _LazyModule:
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        value = getattr(module, attr)
+        # Cached on the instance, so __getattr__ is called only once
+        # for each attribute.
+        setattr(self, attr, value)
+        return value
+
+
+np = _LazyModule('numpy')
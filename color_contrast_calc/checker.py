@@ -5,6 +5,10 @@ contrast ratio of colors.  A color is given as RGB value (represented
 as a tuple of integers) or a hex color code such "#ffff00".
 '''
 
+from functools import lru_cache
+
+from ._lazy_numpy import np
+
 from . import utils
 from . import const
 
@@ -20,6 +24,9 @@ _LEVEL_TO_RATIO = {
     WCAGLevel.A: 3,
 }
 
+# Levels indexed by the codes returned from ratios_to_levels()
+LEVELS_BY_CODE = ('-', WCAGLevel.A, WCAGLevel.AA, WCAGLevel.AAA)
+
 
 # https://www.w3.org/TR/2008/REC-WCAG20-20081211/#relativeluminancedef
 
@@ -38,10 +45,20 @@ def relative_luminance(rgb):
     if isinstance(rgb, str):
         rgb = utils.hex_to_rgb(rgb)
 
-    (r, g, b) = (_tristimulus_value(c) for c in rgb)
+    (r, g, b) = (_tristimulus(c) for c in rgb)
     return r * 0.2126 + g  * 0.7152 + b * 0.0722
 
 
+def _tristimulus(primary_color):
+    # The table covers only the integers from 0 to 255: other values,
+    # such as floats or those out of range produced by some converters,
+    # are calculated.
+    if isinstance(primary_color, int) and 0 <= primary_color <= 255:
+        return _TRISTIMULUS_VALUES[primary_color]
+
+    return _tristimulus_value(primary_color)
+
+
 def _tristimulus_value(primary_color):
     base = 255
     s = float(primary_color) / base
@@ -52,6 +69,52 @@ def _tristimulus_value(primary_color):
     return pow((s + 0.055) / 1.055, 2.4)
 
 
+# A primary color takes one of 256 integer values, so the tristimulus
+# values are calculated once and looked up afterwards.  The NumPy
+# version of the table is taken from the tuple, since np.power is not
+# guaranteed to round exactly like pow().
+_TRISTIMULUS_VALUES = tuple(_tristimulus_value(c) for c in range(256))
+
+
+@lru_cache(maxsize=None)
+def _tristimulus_array():
+    return np.array(_TRISTIMULUS_VALUES)
+
+
+def relative_luminance_many(rgbs):
+    """Calculate the relative luminance of many RGB colors at once.
+
+    The result is identical to that of ``relative_luminance()`` applied
+    to each color one by one.
+    :param rgbs: RGB colors given as an array of shape (N, 3), a list
+                 of tuples of integers or a list of hex color codes.
+    :type rgbs: numpy.ndarray or list of (int, int, int) or list of str
+    :return: Relative luminance of each of the passed colors.
+    :rtype: numpy.ndarray of float64
+    """
+    linear = _tristimulus_array()[_to_rgb_array(rgbs)]
+    (r, g, b) = (linear[:, i] for i in range(3))
+    return r * 0.2126 + g * 0.7152 + b * 0.0722
+
+
+def _to_rgb_array(rgbs):
+    if len(rgbs) and isinstance(rgbs[0], str):
+        hex_codes = rgbs
+        (rgbs, valid) = utils.hex_to_rgb_array(hex_codes)
+
+        if not valid.all():
+            invalid = [c for (c, v) in zip(hex_codes, valid) if not v]
+            raise ValueError('Invalid hex color codes: {}'.format(invalid))
+
+    rgbs = np.asarray(rgbs)
+
+    if rgbs.size and (rgbs.dtype.kind not in 'iu' or
+                      rgbs.min() < 0 or rgbs.max() > 255):
+        raise ValueError('RGB values must be integers from 0 to 255')
+
+    return rgbs.astype(np.intp, copy=False).reshape(-1, 3)
+
+
 # https://www.w3.org/TR/2008/REC-WCAG20-20081211/#contrast-ratiodef
 
 def contrast_ratio(color1, color2):
@@ -88,6 +151,69 @@ def luminance_to_contrast_ratio(luminance1, luminance2):
     return (l1 + 0.05) / (l2 + 0.05)
 
 
+def luminances_to_contrast_ratios(luminances1, luminances2):
+    """Calculate contrast ratios from arrays of relative luminance.
+
+    This is the vectorized counterpart of luminance_to_contrast_ratio(),
+    and the arguments are broadcast against each other.
+    :param luminances1: Relative luminance
+    :type luminances1: numpy.ndarray or float
+    :param luminances2: Relative luminance
+    :type luminances2: numpy.ndarray or float
+    :return: Contrast ratios
+    :rtype: numpy.ndarray
+    """
+    l1 = np.maximum(luminances1, luminances2)
+    l2 = np.minimum(luminances1, luminances2)
+    return (l1 + 0.05) / (l2 + 0.05)
+
+
+def contrast_matrix(colors):
+    """Calculate the contrast ratios of all pairs of given colors.
+
+    The element [i, j] of the returned matrix is the contrast ratio
+    between colors[i] and colors[j], so the matrix is symmetric.  For
+    a large palette, contrast_matrix_blocks() avoids allocating the
+    whole N x N matrix at once.
+    :param colors: RGB colors given as an array of shape (N, 3), a list
+                   of tuples of integers or a list of hex color codes.
+    :type colors: numpy.ndarray or list of (int, int, int) or list of str
+    :return: Contrast ratios
+    :rtype: numpy.ndarray of shape (N, N)
+    """
+    luminances = relative_luminance_many(colors)
+    return luminances_to_contrast_ratios(luminances[:, np.newaxis],
+                                         luminances[np.newaxis, :])
+
+
+def contrast_matrix_blocks(colors, block_size=1024):
+    """Calculate the contrast matrix of given colors block by block.
+
+    Each block is a part of the matrix returned by contrast_matrix(),
+    and at most block_size x block_size ratios are held at a time.
+    :param colors: RGB colors given as an array of shape (N, 3), a list
+                   of tuples of integers or a list of hex color codes.
+    :type colors: numpy.ndarray or list of (int, int, int) or list of str
+    :param block_size: Number of rows/columns of a block [optional]
+    :type block_size: int
+    :return: Generator of (rows, columns, block), where rows and columns
+             are slices that locate the block in the whole matrix.
+    :rtype: generator of (slice, slice, numpy.ndarray)
+    """
+    luminances = relative_luminance_many(colors)
+    n = len(luminances)
+
+    for i in range(0, n, block_size):
+        rows = slice(i, min(i + block_size, n))
+        row_luminances = luminances[rows, np.newaxis]
+
+        for j in range(0, n, block_size):
+            columns = slice(j, min(j + block_size, n))
+            block = luminances_to_contrast_ratios(row_luminances,
+                                                  luminances[columns])
+            yield (rows, columns, block)
+
+
 def ratio_to_level(ratio):
     """Rate a given contrast ratio according to the WCAG 2.0 criteria.
 
@@ -112,6 +238,39 @@ def ratio_to_level(ratio):
     return '-'
 
 
+def ratios_to_levels(ratios):
+    """Rate many contrast ratios at once according to WCAG 2.0.
+
+    This is the vectorized counterpart of ratio_to_level(), but returns
+    small integer codes instead of strings: 0 for "-", 1 for "A", 2 for
+    "AA" and 3 for "AAA".  LEVELS_BY_CODE maps the codes back to levels.
+    :param ratios: Contrast ratios
+    :type ratios: numpy.ndarray or list of float
+    :return: Level codes
+    :rtype: numpy.ndarray of uint8
+    """
+    ratios = np.asarray(ratios)
+    codes = np.zeros(ratios.shape, dtype=np.uint8)
+
+    for level in (WCAGLevel.A, WCAGLevel.AA, WCAGLevel.AAA):
+        codes += ratios >= _LEVEL_TO_RATIO[level]
+
+    return codes
+
+
+def sufficient_mask(ratios, level=WCAGLevel.AA):
+    """Check if each of contrast ratios meets a WCAG 2.0 criterion.
+
+    :param ratios: Contrast ratios
+    :type ratios: numpy.ndarray or list of float
+    :param level: "A", "AA" or "AAA" [optional]
+    :type level: str
+    :return: True for each ratio that meets the specified level
+    :rtype: numpy.ndarray of bool
+    """
+    return np.asarray(ratios) >= level_to_ratio(level)
+
+
 def level_to_ratio(level):
     """Return a contrast ratio required to meet a given WCAG 2.0 level.
 
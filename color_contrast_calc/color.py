@@ -4,23 +4,28 @@ This module also provides lists of predefined colors represented as
 instances of Color class.
 '''
 
-from os import path
-import json
+from functools import lru_cache
 from itertools import product
 
 from . import utils
 from . import checker
+from .color_keywords import COLOR_KEYWORDS
 from .threshold_finders import brightness as brightness_finder
 from .threshold_finders import lightness as lightness_finder
+from .threshold_finders import table as threshold_table
 from .converters import brightness as brightness_conv
 from .converters import contrast as contrast_conv
 from .converters import grayscale as grayscale_conv
 from .converters import hue_rotate as hue_rotate_conv
 from .converters import invert as invert_conv
 from .converters import saturate as saturate_conv
+from .converters.filter_chain import FilterChain
 
 
 class Color:
+    __slots__ = ('__rgb', '__hex', '__name', '__relative_luminance',
+                 '__hsl', '__rgb_code', '_shared')
+
     @classmethod
     def from_name(cls, name):
         """Return an instance of Color for a predefined color name.
@@ -52,10 +57,7 @@ class Color:
         :rtype: Color
         """
         hex_code = utils.rgb_to_hex(rgb)
-        if not name and hex_code in HEX_TO_COLOR:
-            return HEX_TO_COLOR[hex_code]
-
-        return Color(rgb, name)
+        return _shared_color(hex_code, name) or Color(rgb, name)
 
     @classmethod
     def from_hex(cls, hex_code, name=None):
@@ -69,10 +71,23 @@ class Color:
         :rtype: Color
         """
         normalized_hex = utils.normalize_hex(hex_code)
-        if not name and normalized_hex in HEX_TO_COLOR:
-            return HEX_TO_COLOR[normalized_hex]
+        return (_shared_color(normalized_hex, name) or
+                Color(normalized_hex, name))
 
-        return Color(normalized_hex, name)
+    @classmethod
+    def from_int(cls, packed, name=None):
+        """Return an instance of Color for a packed 24-bit integer.
+
+        :param packed: Integer such as 0xffff00
+        :type packed: int
+        :param name: You can name the color to be created [optional]
+        :type name: str
+        :return: an instance of Color
+        :rtype: Color
+        """
+        hex_code = utils.int_to_hex(packed)
+        return (_shared_color(hex_code, name) or
+                Color(utils.int_to_rgb(packed), name))
 
     @classmethod
     def from_hsl(cls, hsl, name=None):
@@ -86,10 +101,7 @@ class Color:
         :rtype: Color
         """
         hex_code = utils.hsl_to_hex(hsl)
-        if not name and hex_code in HEX_TO_COLOR:
-            return HEX_TO_COLOR[hex_code]
-
-        return cls(hex_code, name)
+        return _shared_color(hex_code, name) or cls(hex_code, name)
 
     def __init__(self, rgb, name=None):
         """Create an instance of Color.
@@ -106,19 +118,95 @@ class Color:
         :rtype: Color
         """
         if isinstance(rgb, str):
-            self.rgb = utils.hex_to_rgb(rgb)
+            self.__rgb = utils.hex_to_rgb(rgb)
         else:
-            self.rgb = rgb
+            self.__rgb = rgb
 
-        self.hex = utils.rgb_to_hex(self.rgb)
-        self.name = name or self.common_name
-        self.relative_luminance = checker.relative_luminance(self.rgb)
+        self._shared = False
+        self.__hex = None
+        self.__name = name
+        self.__relative_luminance = None
         self.__hsl = None
         self.__rgb_code = None
 
     def __str__(self):
         return self.hex
 
+    @property
+    def rgb(self):
+        """Return the RGB value of the color.
+
+        :return: RGB value represented as a tuple of integers
+        :rtype: (int, int, int)
+        """
+        return self.__rgb
+
+    @rgb.setter
+    def rgb(self, rgb):
+        self.__check_not_shared('rgb')
+        self.__rgb = rgb
+        self.__hex = None
+        self.__relative_luminance = None
+        self.__hsl = None
+        self.__rgb_code = None
+
+    @property
+    def hex(self):
+        """Return the hex color code of the color.
+
+        :return: Normalized hex color code such as "#ffff00"
+        :rtype: str
+        """
+        if self.__hex is None:
+            self.__hex = utils.rgb_to_hex(self.rgb)
+
+        return self.__hex
+
+    @hex.setter
+    def hex(self, hex_code):
+        self.__check_not_shared('hex')
+        self.__hex = hex_code
+
+    @property
+    def name(self):
+        """Return the name of the color.
+
+        :return: The name given to the constructor, or if it is not
+                 given, the value of self.common_name
+        :rtype: str
+        """
+        # The common name is not stored, as it changes with self.rgb.
+        return self.__name or self.common_name
+
+    @name.setter
+    def name(self, name):
+        self.__check_not_shared('name')
+        self.__name = name
+
+    def __check_not_shared(self, attr):
+        # Colors from the intern pool are returned to every caller asking
+        # for the same color, so they must not be changed by one of them.
+        if self._shared:
+            raise AttributeError(
+                "can't set {} of a Color shared by interning".format(attr))
+
+    @property
+    def relative_luminance(self):
+        """Return the relative luminance of the color.
+
+        :return: Relative luminance
+        :rtype: float
+        """
+        if self.__relative_luminance is None:
+            self.__relative_luminance = checker.relative_luminance(self.rgb)
+
+        return self.__relative_luminance
+
+    @relative_luminance.setter
+    def relative_luminance(self, luminance):
+        self.__check_not_shared('relative_luminance')
+        self.__relative_luminance = luminance
+
     @property
     def hsl(self):
         """Return HSL value of the color.
@@ -368,29 +456,77 @@ class Color:
         """
         return self.__generate_new_color(grayscale_conv, ratio, name)
 
+    def with_filter(self, filter_chain, name=None):
+        """Return a new instance of Color with filter functions applied.
+
+        :param filter_chain: Value of CSS filter property such as
+                             "brightness(120%) hue-rotate(30deg)", or
+                             an instance of FilterChain
+        :type filter_chain: str or FilterChain
+        :param name: You can name the color to be created.
+                     Without this option, the value of normalized hex
+                     color code is assigned instead. [optional]
+        :type name: str
+        :return: New color with the filter functions applied
+        :rtype: Color
+        """
+        if not isinstance(filter_chain, FilterChain):
+            filter_chain = FilterChain(filter_chain)
+
+        return self.__class__(filter_chain.calc_rgb(self.rgb), name)
+
     def __generate_new_color(self, calc, ratio, name=None):
         new_rgb = calc.calc_rgb(self.rgb, ratio)
         return self.__class__(new_rgb, name)
 
     def find_brightness_threshold(self, other_color,
-                                  level=checker.WCAGLevel.AA):
+                                  level=checker.WCAGLevel.AA,
+                                  method='bisection'):
         """Try to find a color who has a satisfying contrast ratio.
 
         The returned color is gained by modifying the brightness of
         another color.  Even when a color that satisfies the specified
         level is not found, it returns a new color anyway.
+        If a table for this color is registered with
+        threshold_finders.table.register(), the result of "bisection" is
+        taken from it.
         :param other_color: Color before the adjustment of brightness
         :type other_color: Color or (int, int, int) or str
         :param level: "A", "AA" or "AAA" [optional]
         :type level: str
+        :param method: "bisection" or "analytic".  With "analytic", the
+                       ratio of brightness is estimated from the target
+                       luminance, and the returned color is the one
+                       whose contrast ratio is the closest to the target
+                       among those satisfying the level.  This color
+                       may differ from the one "bisection" returns: it
+                       satisfies the level whenever the latter does,
+                       with a contrast ratio no higher than the
+                       latter's, and otherwise it is the same color.
+                       See README.rst. [optional]
+        :type method: str
         :return: New color whose brightness is adjusted from that of
                  other_color
         :rtype: Color
         """
+        if method not in _BRIGHTNESS_FINDERS:
+            raise ValueError('Unknown method: {}'.format(method))
+
         if not isinstance(other_color, Color):
             other_color = Color(other_color)
 
-        return Color(brightness_finder.find(self.rgb, other_color.rgb, level))
+        new_rgb = None
+        if method == 'bisection':
+            new_rgb = threshold_table.lookup('brightness', self.rgb,
+                                             other_color.rgb, level)
+
+        if new_rgb is None:
+            find = _BRIGHTNESS_FINDERS[method]
+            new_rgb = find(self.rgb, other_color.rgb, level,
+                           self.relative_luminance,
+                           other_color.relative_luminance)
+
+        return Color(new_rgb)
 
     def find_lightness_threshold(self, other_color,
                                  level=checker.WCAGLevel.AA):
@@ -399,6 +535,8 @@ class Color:
         The returned color is gained by modifying the lightness of
         another color.  Even when a color that satisfies the specified
         level is not found, it returns a new color anyway.
+        If a table for this color is registered with
+        threshold_finders.table.register(), the result is taken from it.
         :param other_color: Color before the adjustment of lightness
         :type other_color: Color or (int, int, int) or str
         :param level: "A", "AA" or "AAA" [optional]
@@ -410,34 +548,96 @@ class Color:
         if not isinstance(other_color, Color):
             other_color = Color(other_color)
 
-        return Color(lightness_finder.find(self.rgb, other_color.rgb, level))
+        new_rgb = threshold_table.lookup('lightness', self.rgb,
+                                         other_color.rgb, level)
 
+        if new_rgb is None:
+            new_rgb = lightness_finder.find(self.rgb, other_color.rgb, level,
+                                            self.relative_luminance,
+                                            other_color.relative_luminance)
 
-_here = path.abspath(path.dirname(__file__))
+        return Color(new_rgb)
 
-# named colors: https://www.w3.org/TR/SVG/types.html#ColorKeywords
-with open(path.join(_here, 'color_keywords.json')) as f:
-    _color_keywords = json.loads(f.read())
 
-NAMED_COLORS = tuple(Color(hex, name) for name, hex in _color_keywords)
+_BRIGHTNESS_FINDERS = {
+    'bisection': brightness_finder.find,
+    'analytic': brightness_finder.find_analytic,
+}
+
+# named colors: https://www.w3.org/TR/SVG/types.html#ColorKeywords
+NAMED_COLORS = tuple(Color(utils.int_to_rgb(packed), name)
+                     for (name, packed) in COLOR_KEYWORDS)
 
 NAME_TO_COLOR = {color.name: color for color in NAMED_COLORS}
 
 HEX_TO_COLOR = {color.hex: color for color in NAMED_COLORS}
 
+_intern_pool = None
+
+
+def enable_interning(maxsize=1024):
+    """Share instances of Color among unnamed colors.
+
+    Once enabled, Color.from_rgb(), Color.from_hex(), Color.from_hsl()
+    and color_contrast_calc.color_from() called without a name return
+    the same instance for the same color, as long as the color is one
+    of ``maxsize`` recently used ones.  As the instances are shared,
+    setting their rgb or name raises AttributeError.
+    :param maxsize: Maximum number of colors kept in the pool.  If None
+                    is given, the pool grows without bound. [optional]
+    :type maxsize: int or None
+    """
+    global _intern_pool
+    _intern_pool = lru_cache(maxsize=maxsize)(_new_shared_color)
+
+
+def disable_interning():
+    """Stop sharing instances of Color and discard the intern pool."""
+    global _intern_pool
+    _intern_pool = None
+
+
+def interning_info():
+    """Return statistics of the intern pool.
+
+    :return: (hits, misses, maxsize, currsize) as returned by
+             cache_info() of functools.lru_cache, or None if interning
+             is not enabled
+    :rtype: functools._CacheInfo or None
+    """
+    if _intern_pool is None:
+        return None
+
+    return _intern_pool.cache_info()
+
+
+def _new_shared_color(hex_code):
+    color = Color(hex_code)
+    color._shared = True
+    return color
+
+
+def _shared_color(hex_code, name=None):
+    if name:
+        return None
+
+    if hex_code in HEX_TO_COLOR:
+        return HEX_TO_COLOR[hex_code]
+
+    if _intern_pool is not None:
+        return _intern_pool(hex_code)
+
+    return None
+
 
 def _generate_web_safe_colors():
-    colors = []
     web_safe_values = [c * 17 for c in range(0, 16, 3)]
 
-    for rgb in [tuple(c) for c in sorted(product(web_safe_values, repeat=3))]:
-        hex_code = utils.rgb_to_hex(rgb)
-        if hex_code in HEX_TO_COLOR:
-            colors.append(HEX_TO_COLOR[hex_code])
-        else:
-            colors.append(Color(hex_code))
-
-    return tuple(colors)
+    # product() yields RGB values already sorted.  The colors are created
+    # from them directly, so only their hex codes are calculated here;
+    # the other properties are left until they are used.
+    return tuple(HEX_TO_COLOR.get(utils.rgb_to_hex(rgb)) or Color(rgb)
+                 for rgb in product(web_safe_values, repeat=3))
 
 
 WEB_SAFE_COLORS = _generate_web_safe_colors()
@@ -1,5 +1,12 @@
 import math
 
+from .._lazy_numpy import np
+
+
+# Number of matrices kept by each of the converters that build a matrix
+# for a given ratio or degree
+MATRIX_CACHE_SIZE = 256
+
 
 def rgb_clamp(vals):
     """Clamp the value of each RGB component to the range of 0 to 255"""
@@ -11,3 +18,41 @@ def _adjusted_round(n):
         return int(math.ceil(n))
 
     return int(round(n))
+
+
+def multiply_coefficients(coefficients, rgb):
+    """Multiply a RGB value by a 3x3 matrix given as tuples of floats.
+
+    This is the counterpart of multiply_matrix() for a single color,
+    which avoids creating NumPy objects.
+    """
+    (r, g, b) = rgb
+    return tuple(m0 * r + m1 * g + m2 * b for (m0, m1, m2) in coefficients)
+
+
+def rgb_clamp_array(vals):
+    """Clamp each RGB component of an array to the range of 0 to 255
+
+    The components are rounded in the same way as in rgb_clamp().
+    """
+    clamped = np.clip(vals, 0, 255)
+    rounded = np.where(np.modf(clamped)[0] == 0.5,
+                       np.ceil(clamped), np.round(clamped))
+    return rounded.astype(np.uint8)
+
+
+def as_rgb_array(rgbs):
+    """Return RGB values as a float array of shape (N, 3)"""
+    return np.asarray(rgbs, dtype=np.float64).reshape(-1, 3)
+
+
+def multiply_matrix(matrix, rgbs):
+    """Multiply each of RGB values in an array of shape (N, 3) by a 3x3
+    matrix.
+
+    The products are summed in the same order as (matrix * rgb).sum(1)
+    for a single color, which a BLAS matmul does not guarantee.
+    """
+    return (rgbs[:, 0, np.newaxis] * matrix[:, 0] +
+            rgbs[:, 1, np.newaxis] * matrix[:, 1] +
+            rgbs[:, 2, np.newaxis] * matrix[:, 2])
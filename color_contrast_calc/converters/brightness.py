@@ -1,7 +1,7 @@
 # https://www.w3.org/TR/filter-effects/#funcdef-brightness
 # https://www.w3.org/TR/SVG/filters.html#TransferFunctionElementAttributes
 
-from . import rgb_clamp
+from . import rgb_clamp, rgb_clamp_array, as_rgb_array
 
 
 def calc_rgb(rgb, ratio=100):
@@ -18,3 +18,19 @@ def calc_rgb(rgb, ratio=100):
     """
     r = float(ratio)
     return rgb_clamp(c * r / 100 for c in rgb)
+
+
+def calc_rgb_many(rgbs, ratio=100):
+    """Return brightness adjusted RGB values of passed colors.
+
+    The results are identical to those of calc_rgb().
+    :param rgbs: The Original RGB values before the adjustment, given
+                 as an array of shape (N, 3).
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :param ratio: Adjustment ratio in percentage [optional]
+    :type ratio: float
+    :return: Brightness adjusted RGB values
+    :rtype: numpy.ndarray of uint8
+    """
+    r = float(ratio)
+    return rgb_clamp_array(as_rgb_array(rgbs) * r / 100)
@@ -0,0 +1,258 @@
+# https://www.w3.org/TR/filter-effects/#FilterProperty
+# https://www.w3.org/TR/filter-effects/#supported-filter-functions
+
+'''Provide FilterChain that applies a series of filter functions such as
+"brightness(120%) saturate(80%) hue-rotate(30deg)" to colors in one
+pass.
+'''
+
+import math
+import re
+
+from .._lazy_numpy import np
+
+from . import rgb_clamp_array, as_rgb_array, multiply_matrix
+from . import brightness
+from . import contrast
+from . import grayscale
+from . import hue_rotate
+from . import invert
+from . import saturate
+
+
+_CONVERTERS = {
+    'brightness': brightness,
+    'contrast': contrast,
+    'grayscale': grayscale,
+    'hue-rotate': hue_rotate,
+    'invert': invert,
+    'saturate': saturate,
+}
+
+# Amount assumed when the argument of a filter function is omitted
+_DEFAULT_AMOUNTS = {
+    'brightness': 100,
+    'contrast': 100,
+    'grayscale': 100,
+    'hue-rotate': 0,
+    'invert': 100,
+    'saturate': 100,
+}
+
+# Filter functions whose amount over 100% is clamped to 100%
+_CLAMPED_TO_100 = ('grayscale', 'invert')
+
+_ANGLE_UNITS = {
+    None: 1,
+    'deg': 1,
+    'grad': 0.9,
+    'rad': 180 / math.pi,
+    'turn': 360,
+}
+
+_FUNCTION_RE = re.compile(r'\s*([a-z-]+)\(\s*([^()]*?)\s*\)\s*', re.IGNORECASE)
+
+_AMOUNT_RE = re.compile(r'\A([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)' +
+                        r'(%|deg|grad|rad|turn)?\Z', re.IGNORECASE)
+
+
+class FilterChain:
+    def __init__(self, steps, round_each_step=True):
+        """Create a chain of filter functions.
+
+        With ``round_each_step`` set to True, the results are identical
+        to those of chaining the corresponding ``Color.with_*`` methods,
+        where each step rounds the RGB values to integers.  Set to False,
+        the steps are calculated without intermediate rounding as in
+        the Filter Effects specification: consecutive steps are composed
+        into one matrix as long as none of them can produce a value out
+        of the range of 0 to 255, and the values are clamped after the
+        steps that can.  As in the specification, the amounts of
+        grayscale and invert over 100% are clamped to 100%, and
+        negative amounts are invalid except for hue-rotate.
+        :param steps: CSS filter value such as "brightness(120%)
+                      hue-rotate(30deg)", or list of (converter, amount)
+                      where converter is a module under
+                      color_contrast_calc.converters or its name
+        :type steps: str or list of (module or str, float)
+        :param round_each_step: If set to False, RGB values are rounded
+                                only once at the end [optional]
+        :type round_each_step: bool
+        """
+        if isinstance(steps, str):
+            steps = parse_filter(steps)
+
+        self.steps = tuple(_step(c, a) for (c, a) in steps)
+        self.round_each_step = round_each_step
+        self._segments = None
+
+        if not round_each_step:
+            self._segments = _compose_segments(self.steps)
+
+    def calc_rgb(self, rgb):
+        """Return the RGB value of a color after applying the chain.
+
+        :param rgb: The Original RGB value
+        :type rgb: (int, int, int)
+        :return: Filtered RGB value
+        :rtype: (int, int, int)
+        """
+        if not self.round_each_step:
+            return tuple(self.calc_rgb_many([rgb])[0].tolist())
+
+        for (converter, amount) in self.steps:
+            rgb = converter.calc_rgb(rgb, amount)
+
+        return tuple(rgb)
+
+    def calc_rgb_many(self, rgbs):
+        """Return the RGB values of colors after applying the chain.
+
+        :param rgbs: The Original RGB values given as an array of shape
+                     (N, 3)
+        :type rgbs: numpy.ndarray or list of (int, int, int)
+        :return: Filtered RGB values
+        :rtype: numpy.ndarray of uint8
+        """
+        if self.round_each_step:
+            rgbs = np.asarray(rgbs, dtype=np.uint8).reshape(-1, 3)
+
+            for (converter, amount) in self.steps:
+                rgbs = converter.calc_rgb_many(rgbs, amount)
+
+            return rgbs
+
+        values = as_rgb_array(rgbs)
+
+        for (matrix, offset) in self._segments:
+            values = np.clip(multiply_matrix(matrix, values) + offset, 0, 255)
+
+        return rgb_clamp_array(values)
+
+
+def parse_filter(css_filter):
+    """Parse the value of CSS filter property.
+
+    Only the functions that have a counterpart in
+    color_contrast_calc.converters are supported.
+    :param css_filter: Value such as "brightness(120%) saturate(0.8)"
+    :type css_filter: str
+    :return: List of (name, amount), where amount is in percentage, or
+             in degrees for hue-rotate
+    :rtype: list of (str, float)
+    """
+    if css_filter.strip().lower() == 'none':
+        return []
+
+    if not css_filter.strip():
+        raise ValueError('Invalid filter: {!r}'.format(css_filter))
+
+    if _FUNCTION_RE.sub('', css_filter) != '':
+        raise ValueError('Invalid filter: {}'.format(css_filter))
+
+    return [_parse_function(name.lower(), arg)
+            for (name, arg) in _FUNCTION_RE.findall(css_filter)]
+
+
+def _parse_function(name, arg):
+    if name not in _CONVERTERS:
+        raise ValueError('Unsupported filter function: {}'.format(name))
+
+    if not arg:
+        return (name, _DEFAULT_AMOUNTS[name])
+
+    m = _AMOUNT_RE.match(arg)
+    if m is None:
+        raise ValueError('Invalid argument: {}({})'.format(name, arg))
+
+    value = float(m.group(1))
+    unit = m.group(2) and m.group(2).lower()
+
+    if name == 'hue-rotate':
+        if unit == '%':
+            raise ValueError('Invalid angle: {}({})'.format(name, arg))
+        return (name, value * _ANGLE_UNITS[unit])
+
+    if unit not in (None, '%') or value < 0:
+        raise ValueError('Invalid amount: {}({})'.format(name, arg))
+
+    amount = value if unit == '%' else value * 100
+
+    if name in _CLAMPED_TO_100:
+        amount = min(amount, 100)
+
+    return (name, amount)
+
+
+def _step(converter, amount):
+    converter = _converter(converter)
+    amount = float(amount)
+
+    # As in parse_filter(), only the angle of hue-rotate can be negative.
+    if converter is not hue_rotate and not amount >= 0:
+        raise ValueError('Invalid amount: {}({})'.format(
+            converter.__name__.rsplit('.', 1)[-1], amount))
+
+    if converter in (_CONVERTERS[name] for name in _CLAMPED_TO_100):
+        amount = min(amount, 100.0)
+
+    return (converter, amount)
+
+
+def _converter(converter):
+    if isinstance(converter, str):
+        return _CONVERTERS[converter.replace('_', '-')]
+
+    return converter
+
+
+def _affine_part(converter, amount):
+    # (matrix, offset) such that the converter calculates
+    # matrix * rgb + offset before rounding and clamping
+    r = amount / 100.0
+
+    if converter is brightness:
+        return (np.identity(3) * r, np.zeros(3))
+    if converter is contrast:
+        return (np.identity(3) * r, np.full(3, 255 * (0.5 - r / 2)))
+    if converter is invert:
+        return (np.identity(3) * (1 - 2 * r), np.full(3, 255 * r))
+    if converter is grayscale:
+        return (grayscale._calc_grayscale(amount), np.zeros(3))
+    if converter is hue_rotate:
+        return (hue_rotate._calc_rotation(amount), np.zeros(3))
+    if converter is saturate:
+        return (saturate._calc_saturation(amount), np.zeros(3))
+
+    raise ValueError('Unsupported converter: {}'.format(converter))
+
+
+def _keeps_range(matrix, offset):
+    # The extremes of an affine map over the RGB cube are reached at
+    # its vertices: each row is lowest with the negative coefficients
+    # and highest with the positive ones applied to 255.
+    lowest = offset + np.minimum(matrix, 0).sum(1) * 255
+    highest = offset + np.maximum(matrix, 0).sum(1) * 255
+    return bool((lowest >= -1e-9).all() and (highest <= 255 + 1e-9).all())
+
+
+def _compose_segments(steps):
+    segments = []
+    (matrix, offset) = (np.identity(3), np.zeros(3))
+    has_pending_steps = False
+
+    for (converter, amount) in steps:
+        (step_matrix, step_offset) = _affine_part(converter, amount)
+        matrix = step_matrix.dot(matrix)
+        offset = step_matrix.dot(offset) + step_offset
+        has_pending_steps = True
+
+        if not _keeps_range(step_matrix, step_offset):
+            segments.append((matrix, offset))
+            (matrix, offset) = (np.identity(3), np.zeros(3))
+            has_pending_steps = False
+
+    if has_pending_steps:
+        segments.append((matrix, offset))
+
+    return segments
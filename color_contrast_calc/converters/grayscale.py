@@ -2,18 +2,22 @@
 # https://www.w3.org/TR/filter-effects/#grayscaleEquivalent
 # https://www.w3.org/TR/SVG/filters.html#feColorMatrixElement
 
-import numpy as np
+from functools import lru_cache
 
-from . import rgb_clamp
+from .._lazy_numpy import np
 
+from . import MATRIX_CACHE_SIZE
+from . import rgb_clamp, rgb_clamp_array, as_rgb_array
+from . import multiply_coefficients, multiply_matrix
 
-_CONST_PART = np.array([[0.2126, 0.7152, 0.0722],
-                        [0.2126, 0.7152, 0.0722],
-                        [0.2126, 0.7152, 0.0722]])
 
-_RATIO_PART = np.array([[0.7874, -0.7152, -0.0722],
-                        [-0.2126, 0.2848, -0.0722],
-                        [-0.2126, -0.7152, 0.9278]])
+_CONST_PART = ((0.2126, 0.7152, 0.0722),
+               (0.2126, 0.7152, 0.0722),
+               (0.2126, 0.7152, 0.0722))
+
+_RATIO_PART = ((0.7874, -0.7152, -0.0722),
+               (-0.2126, 0.2848, -0.0722),
+               (-0.2126, -0.7152, 0.9278))
 
 
 def calc_rgb(rgb, s):
@@ -29,9 +33,46 @@ def calc_rgb(rgb, s):
     :rtype: (int, int, int)
     """
 
-    return rgb_clamp((_calc_grayscale(s) * np.array(rgb)).sum(1))
+    return rgb_clamp(multiply_coefficients(_calc_coefficients(s), rgb))
 
 
-def _calc_grayscale(s):
+def matrix_cache_info():
+    """Return statistics of the cache of grayscale matrices.
+
+    The single-color calc_rgb() and the matrices for calc_rgb_many()
+    share the cached coefficients.
+    :return: (hits, misses, maxsize, currsize) as returned by
+             cache_info() of functools.lru_cache
+    :rtype: functools._CacheInfo
+    """
+    return _calc_coefficients.cache_info()
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _calc_coefficients(s):
     r = 1 - min((100, s)) / 100.0
-    return _CONST_PART + _RATIO_PART * r
+    return tuple(tuple(c + rp * r for (c, rp) in zip(*rows))
+                 for rows in zip(_CONST_PART, _RATIO_PART))
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _calc_grayscale(s):
+    matrix = np.array(_calc_coefficients(s))
+    matrix.flags.writeable = False
+    return matrix
+
+
+def calc_rgb_many(rgbs, s):
+    """Convert passed colors to grayscale.
+
+    The results are identical to those of calc_rgb().
+    :param rgbs: The Original RGB values before the conversion, given
+                 as an array of shape (N, 3).
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :param s: Conversion ratio in percentage
+    :type s: float
+    :return: RGB values of grayscale colors
+    :rtype: numpy.ndarray of uint8
+    """
+    return rgb_clamp_array(multiply_matrix(_calc_grayscale(s),
+                                           as_rgb_array(rgbs)))
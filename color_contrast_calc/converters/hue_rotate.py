@@ -1,22 +1,27 @@
 # https://www.w3.org/TR/filter-effects/#funcdef-hue-rotate
 # https://www.w3.org/TR/SVG/filters.html#TransferFunctionElementAttributes
 
-import numpy as np
+from functools import lru_cache
+import math
 
-from . import rgb_clamp
+from .._lazy_numpy import np
 
+from . import MATRIX_CACHE_SIZE
+from . import rgb_clamp, rgb_clamp_array, as_rgb_array
+from . import multiply_coefficients, multiply_matrix
 
-CONST_PART = np.array([[0.213, 0.715, 0.072],
-                       [0.213, 0.715, 0.072],
-                       [0.213, 0.715, 0.072]])
 
-COS_PART = np.array([[0.787, -0.715, -0.072],
-                     [-0.213, 0.285, -0.072],
-                     [-0.213, -0.715, 0.928]])
+CONST_PART = ((0.213, 0.715, 0.072),
+              (0.213, 0.715, 0.072),
+              (0.213, 0.715, 0.072))
 
-SIN_PART = np.array([[-0.213, -0.715, 0.928],
-                     [0.143, 0.140, -0.283],
-                     [-0.787, 0.715, 0.072]])
+COS_PART = ((0.787, -0.715, -0.072),
+            (-0.213, 0.285, -0.072),
+            (-0.213, -0.715, 0.928))
+
+SIN_PART = ((-0.213, -0.715, 0.928),
+            (0.143, 0.140, -0.283),
+            (-0.787, 0.715, 0.072))
 
 
 def calc_rgb(rgb, deg):
@@ -31,15 +36,52 @@ def calc_rgb(rgb, deg):
     :return: Hue rotation applied RGB value
     :rtype: (int, int, int)
     """
-    return rgb_clamp((_calc_rotation(deg) * np.array(rgb)).sum(1))
+    return rgb_clamp(multiply_coefficients(_calc_coefficients(deg), rgb))
 
 
 def _deg_to_rad(deg):
-    return np.pi * deg / 180
+    return math.pi * deg / 180
 
 
-def _calc_rotation(deg):
+def matrix_cache_info():
+    """Return statistics of the cache of rotation matrices.
+
+    The single-color calc_rgb() and the matrices for calc_rgb_many()
+    share the cached coefficients.
+    :return: (hits, misses, maxsize, currsize) as returned by
+             cache_info() of functools.lru_cache
+    :rtype: functools._CacheInfo
+    """
+    return _calc_coefficients.cache_info()
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _calc_coefficients(deg):
     rad = _deg_to_rad(deg)
-    cos_part = COS_PART * np.cos(rad)
-    sin_part = SIN_PART * np.sin(rad)
-    return CONST_PART + cos_part + sin_part
+    (cos, sin) = (math.cos(rad), math.sin(rad))
+    return tuple(tuple(c + cp * cos + sp * sin
+                       for (c, cp, sp) in zip(*rows))
+                 for rows in zip(CONST_PART, COS_PART, SIN_PART))
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _calc_rotation(deg):
+    matrix = np.array(_calc_coefficients(deg))
+    matrix.flags.writeable = False
+    return matrix
+
+
+def calc_rgb_many(rgbs, deg):
+    """Return hue rotation applied RGB values of passed colors.
+
+    The results are identical to those of calc_rgb().
+    :param rgbs: The Original RGB values before the rotation, given
+                 as an array of shape (N, 3).
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :param deg: Degrees of rotation (0 to 360)
+    :type deg: float
+    :return: Hue rotation applied RGB values
+    :rtype: numpy.ndarray of uint8
+    """
+    return rgb_clamp_array(multiply_matrix(_calc_rotation(deg),
+                                           as_rgb_array(rgbs)))
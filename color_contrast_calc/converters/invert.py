@@ -2,6 +2,10 @@
 # https://www.w3.org/TR/filter-effects-1/#invertEquivalent
 # https://www.w3.org/TR/SVG/filters.html#TransferFunctionElementAttributes
 
+from .._lazy_numpy import np
+
+from . import as_rgb_array
+
 
 def calc_rgb(rgb, ratio):
     """Return an inverted RGB value of passed color.
@@ -17,3 +21,26 @@ def calc_rgb(rgb, ratio):
     """
     r = float(ratio)
     return tuple(round((100 * c - 2 * c * r + 255 * r) / 100) for c in rgb)
+
+
+def calc_rgb_many(rgbs, ratio):
+    """Return inverted RGB values of passed colors.
+
+    The results are identical to those of calc_rgb().  Unlike calc_rgb(),
+    the ratio must be in the range of 0 to 100, since other ratios give
+    values that do not fit in uint8.
+    :param rgbs: The Original RGB values before the inversion, given
+                 as an array of shape (N, 3).
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :param ratio: Proportion of the conversion in percentage.
+    :type ratio: float
+    :return: Inverted RGB values
+    :rtype: numpy.ndarray of uint8
+    """
+    r = float(ratio)
+
+    if not 0 <= r <= 100:
+        raise ValueError('Ratio out of the range of 0 to 100: {}'.format(r))
+
+    c = as_rgb_array(rgbs)
+    return np.round((100 * c - 2 * c * r + 255 * r) / 100).astype(np.uint8)
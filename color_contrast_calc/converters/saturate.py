@@ -1,18 +1,22 @@
 # https://www.w3.org/TR/filter-effects/#funcdef-saturate
 # https://www.w3.org/TR/SVG/filters.html#feColorMatrixElement
 
-import numpy as np
+from functools import lru_cache
 
-from . import rgb_clamp
+from .._lazy_numpy import np
 
+from . import MATRIX_CACHE_SIZE
+from . import rgb_clamp, rgb_clamp_array, as_rgb_array
+from . import multiply_coefficients, multiply_matrix
 
-_CONST_PART = np.array([[0.213, 0.715, 0.072],
-                        [0.213, 0.715, 0.072],
-                        [0.213, 0.715, 0.072]])
 
-_SATURATE_PART = np.array([[0.787, -0.715, -0.072],
-                           [-0.213, 0.285, -0.072],
-                           [-0.213, -0.715, 0.928]])
+_CONST_PART = ((0.213, 0.715, 0.072),
+               (0.213, 0.715, 0.072),
+               (0.213, 0.715, 0.072))
+
+_SATURATE_PART = ((0.787, -0.715, -0.072),
+                  (-0.213, 0.285, -0.072),
+                  (-0.213, -0.715, 0.928))
 
 
 def calc_rgb(rgb, s):
@@ -27,8 +31,46 @@ def calc_rgb(rgb, s):
     :return: Saturated RGB value
     :rtype: (int, int, int)
     """
-    return rgb_clamp((_calc_saturation(s) * np.array(rgb)).sum(1))
+    return rgb_clamp(multiply_coefficients(_calc_coefficients(s), rgb))
+
+
+def matrix_cache_info():
+    """Return statistics of the cache of saturation matrices.
+
+    The single-color calc_rgb() and the matrices for calc_rgb_many()
+    share the cached coefficients.
+    :return: (hits, misses, maxsize, currsize) as returned by
+             cache_info() of functools.lru_cache
+    :rtype: functools._CacheInfo
+    """
+    return _calc_coefficients.cache_info()
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _calc_coefficients(s):
+    r = s / 100.0
+    return tuple(tuple(c + sp * r for (c, sp) in zip(*rows))
+                 for rows in zip(_CONST_PART, _SATURATE_PART))
 
 
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
 def _calc_saturation(s):
-    return _CONST_PART + _SATURATE_PART * (s / 100.0)
+    matrix = np.array(_calc_coefficients(s))
+    matrix.flags.writeable = False
+    return matrix
+
+
+def calc_rgb_many(rgbs, s):
+    """Return saturated RGB values of passed colors.
+
+    The results are identical to those of calc_rgb().
+    :param rgbs: The Original RGB values before the saturation, given
+                 as an array of shape (N, 3).
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :param s: Proprtion of the conversion in percentage
+    :type s: float
+    :return: Saturated RGB values
+    :rtype: numpy.ndarray of uint8
+    """
+    return rgb_clamp_array(multiply_matrix(_calc_saturation(s),
+                                           as_rgb_array(rgbs)))
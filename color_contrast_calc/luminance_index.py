@@ -0,0 +1,114 @@
+'''Provide LuminanceIndex that holds the relative luminance of every
+sRGB color.
+
+The index is optional: it costs 128 MB (or 64 MB with float32) and
+pays off only when the luminance of a very large number of colors is
+looked up.  When a cache file is given, the table is stored there as
+a .npy file and loaded with ``numpy.load(..., mmap_mode='r')``, so
+worker processes share the same pages instead of rebuilding it.
+'''
+
+import os
+
+import numpy as np
+
+from . import checker
+from . import utils
+
+
+class LuminanceIndex:
+    SIZE = 1 << 24
+
+    def __init__(self, cache_path=None, dtype=np.float64):
+        """Create an index of the relative luminance of all sRGB colors.
+
+        :param cache_path: Path to a cache file.  If the file exists it
+                           is loaded as a memory-mapped array, otherwise
+                           it is created. [optional]
+        :type cache_path: str
+        :param dtype: numpy.float64 or numpy.float32.  Only with float64
+                      the values are identical to those returned by
+                      checker.relative_luminance() [optional]
+        :type dtype: numpy.dtype
+        """
+        self.dtype = np.dtype(dtype)
+        self.cache_path = cache_path
+
+        if cache_path is None:
+            self.luminances = np.empty(self.SIZE, dtype=self.dtype)
+            _fill_luminances(self.luminances)
+        else:
+            self.luminances = _load_or_build_cache(cache_path, self.dtype)
+
+    def relative_luminance(self, rgb):
+        """Look up the relative luminance of a RGB color.
+
+        :param rgb: RGB color given as a string or a tuple of integers.
+        :type rgb: str or (int, int, int)
+        :return: Relative luminance of the passed color.
+        :rtype: float
+        """
+        if isinstance(rgb, str):
+            rgb = utils.hex_to_rgb(rgb)
+
+        return float(self.luminances[utils.rgb_to_int(rgb)])
+
+    def relative_luminance_many(self, rgbs):
+        """Look up the relative luminance of many RGB colors at once.
+
+        :param rgbs: RGB colors given as an array of shape (N, 3)
+                     or a list of tuples of integers
+        :type rgbs: numpy.ndarray or list of (int, int, int)
+        :return: Relative luminance of each of the passed colors.
+        :rtype: numpy.ndarray
+        """
+        return self.luminances[utils.rgb_array_to_int(rgbs)]
+
+    def lookup(self, packed):
+        """Look up the relative luminance of colors given as integers.
+
+        :param packed: Packed 24-bit integer such as 0xffff00 or an
+                       array of them
+        :type packed: int or numpy.ndarray
+        :return: Relative luminance
+        :rtype: float or numpy.ndarray
+        """
+        return self.luminances[packed]
+
+
+def _fill_luminances(out):
+    values = checker._tristimulus_array()
+    reds = values * 0.2126
+    greens = (values * 0.7152)[:, np.newaxis]
+    blues = (values * 0.0722)[np.newaxis, :]
+    plane = 1 << 16
+
+    # One plane of 65536 colors at a time, to avoid a temporary copy of
+    # the whole table.
+    for r in range(256):
+        out[r * plane:(r + 1) * plane] = ((reds[r] + greens) + blues).ravel()
+
+
+def _load_or_build_cache(cache_path, dtype):
+    if not os.path.exists(cache_path):
+        _build_cache(cache_path, dtype)
+
+    luminances = np.load(cache_path, mmap_mode='r')
+
+    if luminances.shape != (LuminanceIndex.SIZE,) or luminances.dtype != dtype:
+        raise ValueError('{} is not a cache of {} values'.format(cache_path,
+                                                                 dtype))
+
+    return luminances
+
+
+def _build_cache(cache_path, dtype):
+    # Other processes may be building the same cache: each of them writes
+    # its own temporary file and replaces the cache with it atomically.
+    tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype,
+                                    shape=(LuminanceIndex.SIZE,))
+    _fill_luminances(out)
+    out.flush()
+    del out
+    os.replace(tmp_path, cache_path)
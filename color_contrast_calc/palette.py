@@ -0,0 +1,375 @@
+'''Provide indexes that answer queries about a palette of colors.
+
+A palette is a sequence of Color instances such as
+``color_contrast_calc.color.NAMED_COLORS``.
+
+The module-level functions build the index for a palette on the first
+call and reuse it.  A tuple is looked up by identity in constant time,
+while other sequences are copied and hashed on every call: for large
+palettes, pass a tuple or keep an index object instead.
+'''
+
+from functools import lru_cache
+from numbers import Integral
+
+from ._lazy_numpy import np
+
+from . import checker
+from . import utils
+from .color import Color, NAMED_COLORS
+
+
+class Metric:
+    '''Class used as name space for the metrics of color difference.'''
+    RGB = 'rgb'
+    LAB = 'lab'
+
+
+# https://en.wikipedia.org/wiki/SRGB#Correspondence_to_CIE_XYZ_stimulus
+_RGB_TO_XYZ = ((0.4124, 0.3576, 0.1805),
+               (0.2126, 0.7152, 0.0722),
+               (0.0193, 0.1192, 0.9505))
+
+# Reference white D65
+_WHITE_XYZ = (0.95047, 1.0, 1.08883)
+
+_LAB_EPSILON = (6 / 29.0) ** 3
+_LAB_SLOPE = 3 * (6 / 29.0) ** 2
+
+# Maximum number of distances calculated at a time by
+# NearestColorIndex.nearest_indexes(): the queries are split into chunks
+# so that each temporary array holds at most this number of floats
+# (32 MB).
+_DISTANCES_PER_CHUNK = 1 << 22
+
+
+class NearestColorIndex:
+    def __init__(self, palette, metric=Metric.RGB):
+        """Create an index to find the nearest color in a palette.
+
+        The index is a k-d tree built once from the palette.
+        :param palette: Colors to be searched
+        :type palette: list or tuple of Color
+        :param metric: "rgb" for the Euclidean distance in RGB space or
+                       "lab" for the CIE76 color difference [optional]
+        :type metric: str
+        """
+        if metric not in (Metric.RGB, Metric.LAB):
+            raise ValueError('Unknown metric: {}'.format(metric))
+
+        self.palette = tuple(palette)
+        self.metric = metric
+        self._points = [self._to_point(c.rgb) for c in self.palette]
+        self._tree = _build_tree(self._points,
+                                 list(range(len(self._points))), 0)
+
+    def nearest(self, color):
+        """Return the color in the palette nearest to a given color.
+
+        When two colors in the palette are at the same distance, the one
+        that comes first in the palette is returned.
+        :param color: Color, RGB value or hex color code
+        :type color: Color or (int, int, int) or str
+        :return: Nearest color
+        :rtype: Color
+        """
+        point = self._to_point(_to_rgb(color))
+        best = _search_tree(self._tree, self._points, point,
+                            (float('inf'), -1))
+        return self.palette[best[1]]
+
+    def nearest_indexes(self, rgbs):
+        """Return the indexes of the nearest colors in the palette.
+
+        This is the batch version of nearest().
+        :param rgbs: RGB values given as an array of shape (N, 3) or a
+                     list of tuples of integers
+        :type rgbs: numpy.ndarray or list of (int, int, int)
+        :return: Indexes in the palette
+        :rtype: numpy.ndarray of intp
+        """
+        rgbs = checker._to_rgb_array(rgbs)
+        if self.metric == Metric.LAB:
+            points = _rgb_to_lab_array(rgbs)
+        else:
+            points = rgbs.astype(np.float64)
+
+        palette_points = np.array(self._points).reshape(-1, 3).T
+        indexes = np.empty(len(points), dtype=np.intp)
+        palette_size = max(len(self.palette), 1)
+        chunk_size = max(1, _DISTANCES_PER_CHUNK // palette_size)
+
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start:start + chunk_size].T[:, :, np.newaxis]
+            distances = ((chunk[0] - palette_points[0]) ** 2 +
+                         (chunk[1] - palette_points[1]) ** 2 +
+                         (chunk[2] - palette_points[2]) ** 2)
+            indexes[start:start + chunk_size] = distances.argmin(1)
+
+        return indexes
+
+    def _to_point(self, rgb):
+        if self.metric == Metric.LAB:
+            return _rgb_to_lab(rgb)
+
+        return tuple(float(c) for c in rgb)
+
+
+class ContrastIndex:
+    def __init__(self, palette):
+        """Create an index to find colors by contrast ratio.
+
+        The colors in the palette are sorted by relative luminance once.
+        Against a fixed background, the contrast ratio decreases with
+        the luminance of the colors darker than the background and
+        increases with that of the lighter ones, so each query is
+        answered by binary searches on both sides.
+        :param palette: Colors to be searched
+        :type palette: list or tuple of Color
+        """
+        self.palette = tuple(palette)
+        self._order = sorted(range(len(self.palette)),
+                             key=lambda i: self.palette[i].relative_luminance)
+        self._luminances = [self.palette[i].relative_luminance
+                            for i in self._order]
+
+    def colors_with_contrast(self, background, min_ratio=1.0,
+                             max_ratio=21.0):
+        """Return the colors whose contrast ratio against a background is
+        in a given range.
+
+        The result is the same as that of checking
+        ``min_ratio <= color.contrast_ratio_against(background) <=
+        max_ratio`` for each color in the palette.
+        :param background: Color, RGB value or hex color code
+        :type background: Color or (int, int, int) or str
+        :param min_ratio: Lower limit of the contrast ratio [optional]
+        :type min_ratio: float
+        :param max_ratio: Upper limit of the contrast ratio [optional]
+        :type max_ratio: float
+        :return: Colors in the order of the palette
+        :rtype: list of Color
+        """
+        if isinstance(background, Color):
+            background_luminance = background.relative_luminance
+        else:
+            background_luminance = checker.relative_luminance(background)
+
+        luminances = self._luminances
+
+        def ratio(i):
+            return checker.luminance_to_contrast_ratio(luminances[i],
+                                                       background_luminance)
+
+        split = _first_index(0, len(luminances),
+                             lambda i: luminances[i] > background_luminance)
+
+        # Darker side, where the ratio decreases as i increases
+        dark_start = _first_index(0, split, lambda i: ratio(i) <= max_ratio)
+        dark_end = _first_index(dark_start, split,
+                                lambda i: ratio(i) < min_ratio)
+
+        # Lighter side, where the ratio increases as i increases
+        light_start = _first_index(split, len(luminances),
+                                   lambda i: ratio(i) >= min_ratio)
+        light_end = _first_index(light_start, len(luminances),
+                                 lambda i: ratio(i) > max_ratio)
+
+        indexes = (self._order[dark_start:dark_end] +
+                   self._order[light_start:light_end])
+        return [self.palette[i] for i in sorted(indexes)]
+
+
+def nearest_color(color, palette=NAMED_COLORS, metric=Metric.RGB):
+    """Return the color in a palette nearest to a given color.
+
+    The index for the palette is reused as described in the module
+    docstring.
+    :param color: Color, RGB value or hex color code
+    :type color: Color or (int, int, int) or str
+    :param palette: Colors to be searched [optional]
+    :type palette: list or tuple of Color
+    :param metric: "rgb" or "lab" [optional]
+    :type metric: str
+    :return: Nearest color
+    :rtype: Color
+    """
+    index = _nearest_color_index(_palette_key(palette), metric)
+    return index.nearest(color)
+
+
+def nearest_color_indexes(rgbs, palette=NAMED_COLORS, metric=Metric.RGB):
+    """Return the indexes of the colors in a palette nearest to given
+    colors.
+
+    The index for the palette is reused as described in the module
+    docstring.
+    :param rgbs: RGB values given as an array of shape (N, 3) or a list
+                 of tuples of integers
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :param palette: Colors to be searched [optional]
+    :type palette: list or tuple of Color
+    :param metric: "rgb" or "lab" [optional]
+    :type metric: str
+    :return: Indexes in the palette
+    :rtype: numpy.ndarray of intp
+    """
+    index = _nearest_color_index(_palette_key(palette), metric)
+    return index.nearest_indexes(rgbs)
+
+
+def colors_with_contrast(background, min_ratio=1.0, max_ratio=21.0,
+                         palette=NAMED_COLORS):
+    """Return the colors in a palette whose contrast ratio against a
+    background is in a given range.
+
+    The index for the palette is reused as described in the module
+    docstring.
+    :param background: Color, RGB value or hex color code
+    :type background: Color or (int, int, int) or str
+    :param min_ratio: Lower limit of the contrast ratio [optional]
+    :type min_ratio: float
+    :param max_ratio: Upper limit of the contrast ratio [optional]
+    :type max_ratio: float
+    :param palette: Colors to be searched [optional]
+    :type palette: list or tuple of Color
+    :return: Colors in the order of the palette
+    :rtype: list of Color
+    """
+    index = _contrast_index(_palette_key(palette))
+    return index.colors_with_contrast(background, min_ratio, max_ratio)
+
+
+class _Identity:
+    # Key of a tuple hashed and compared by identity.  The key keeps a
+    # reference to the tuple, so its id is not reused while the key is
+    # in a cache.
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def _palette_key(palette):
+    if isinstance(palette, tuple):
+        return _Identity(palette)
+
+    return tuple(palette)
+
+
+def _palette_of(key):
+    return key.value if isinstance(key, _Identity) else key
+
+
+@lru_cache(maxsize=32)
+def _nearest_color_index(palette_key, metric):
+    return NearestColorIndex(_palette_of(palette_key), metric)
+
+
+@lru_cache(maxsize=32)
+def _contrast_index(palette_key):
+    return ContrastIndex(_palette_of(palette_key))
+
+
+def _first_index(lo, hi, predicate):
+    # The smallest i in [lo, hi) for which predicate(i) holds, or hi,
+    # given that predicate(i) implies predicate(i + 1)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if predicate(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
+
+
+def _to_rgb(color):
+    if isinstance(color, Color):
+        return color.rgb
+    if isinstance(color, str):
+        return utils.hex_to_rgb(color)
+
+    # Checked as in checker.relative_luminance_many(), for the tables
+    # of tristimulus values would be indexed with the components.
+    if not all(isinstance(c, Integral) and 0 <= c <= 255 for c in color):
+        raise ValueError('RGB values must be integers from 0 to 255')
+
+    return color
+
+
+# https://en.wikipedia.org/wiki/CIELAB_color_space#From_CIEXYZ_to_CIELAB
+
+def _rgb_to_lab(rgb):
+    linear = [checker._TRISTIMULUS_VALUES[c] for c in rgb]
+    (fx, fy, fz) = (_lab_f((m0 * linear[0] + m1 * linear[1] +
+                            m2 * linear[2]) / white)
+                    for ((m0, m1, m2), white) in zip(_RGB_TO_XYZ, _WHITE_XYZ))
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def _lab_f(t):
+    if t > _LAB_EPSILON:
+        return t ** (1 / 3.0)
+
+    return t / _LAB_SLOPE + 4 / 29.0
+
+
+def _rgb_to_lab_array(rgbs):
+    linear = checker._tristimulus_array()[rgbs]
+    (fx, fy, fz) = (_lab_f_array((m0 * linear[:, 0] + m1 * linear[:, 1] +
+                                  m2 * linear[:, 2]) / white)
+                    for ((m0, m1, m2), white) in zip(_RGB_TO_XYZ, _WHITE_XYZ))
+    return np.stack((116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)), axis=1)
+
+
+def _lab_f_array(t):
+    return np.where(t > _LAB_EPSILON,
+                    np.power(t, 1 / 3.0), t / _LAB_SLOPE + 4 / 29.0)
+
+
+def _build_tree(points, indexes, depth):
+    # A node is (index of the point, splitting axis, left, right)
+    if not indexes:
+        return None
+
+    axis = depth % 3
+    indexes = sorted(indexes, key=lambda i: (points[i][axis], i))
+    median = len(indexes) // 2
+
+    return (indexes[median], axis,
+            _build_tree(points, indexes[:median], depth + 1),
+            _build_tree(points, indexes[median + 1:], depth + 1))
+
+
+def _search_tree(node, points, point, best):
+    if node is None:
+        return best
+
+    (index, axis, left, right) = node
+    p = points[index]
+    d = ((point[0] - p[0]) ** 2 + (point[1] - p[1]) ** 2 +
+         (point[2] - p[2]) ** 2)
+    if d < best[0] or (d == best[0] and index < best[1]):
+        best = (d, index)
+
+    diff = point[axis] - p[axis]
+    if diff < 0:
+        best = _search_tree(left, points, point, best)
+        far = right
+    else:
+        best = _search_tree(right, points, point, best)
+        far = left
+
+    # Points at the same distance are still visited, because one of
+    # them may come earlier in the palette.
+    if diff * diff <= best[0]:
+        best = _search_tree(far, points, point, best)
+
+    return best
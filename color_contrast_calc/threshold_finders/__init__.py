@@ -2,6 +2,11 @@
 methods of Color, ``.find_*_threshold``.
 '''
 
+from .._lazy_numpy import np
+
+from .. import checker
+
+
 def binary_search_width(init_width, min_width):
     i = 1
     init_width = float(init_width)
@@ -39,3 +44,64 @@ def rgb_with_better_ratio(color, criteria, last_r, passing_r, rgb_with_ratio):
         return rgb_with_ratio(color, passing_r)
 
     return closest
+
+
+def broadcast_rgb_arrays(fixed_rgbs, other_rgbs):
+    # (N, 3) arrays of the fixed and other colors of find_many(), where
+    # a single fixed color is repeated for all the rows
+    fixed_rgbs = checker._to_rgb_array(fixed_rgbs)
+    other_rgbs = checker._to_rgb_array(other_rgbs)
+    return tuple(np.ascontiguousarray(a)
+                 for a in np.broadcast_arrays(fixed_rgbs, other_rgbs))
+
+
+def find_ratio_many(other_rgbs, criteria, rgbs_with_ratios,
+                    init_ratios, init_widths):
+    # Runs find_ratio() for each row in lock-step: a row leaves the
+    # search once its width gets to 0.01 or its contrast ratio hits the
+    # target.  Missing passing ratios are given as NaN.
+    target_contrast = criteria.target_contrast
+    r = np.array(init_ratios, dtype=np.float64)
+    passing_r = np.full(len(r), np.nan)
+    init_widths = np.asarray(init_widths, dtype=np.float64)
+    active = np.ones(len(r), dtype=bool)
+    i = 1
+
+    while True:
+        d = init_widths / pow(2, i)
+        active &= d > 0.01
+        rows = np.flatnonzero(active)
+
+        if len(rows) == 0:
+            break
+
+        contrast = criteria.contrast_ratios(
+            rgbs_with_ratios(other_rgbs[rows], r[rows]), rows)
+
+        passing = contrast >= target_contrast
+        passing_r[rows[passing]] = r[rows[passing]]
+
+        hit = contrast == target_contrast
+        active[rows[hit]] = False
+
+        step = np.where(criteria.increment_mask(contrast, rows),
+                        d[rows], -d[rows])
+        r[rows[~hit]] += step[~hit]
+        i += 1
+
+    return (r, passing_r)
+
+
+def rgb_with_better_ratio_many(colors, criteria, last_r, passing_r,
+                               rgbs_with_ratios):
+    closest = rgbs_with_ratios(colors, last_r)
+
+    # NaN and 0.0 are both skipped as falsy passing_r is in
+    # rgb_with_better_ratio().
+    has_passing_r = ~np.isnan(passing_r) & (passing_r != 0)
+    rows = np.flatnonzero(has_passing_r)
+    insufficient = ~criteria.has_sufficient_contrast(closest[rows], rows)
+    rows = rows[insufficient]
+    closest[rows] = rgbs_with_ratios(colors[rows], passing_r[rows])
+
+    return closest
@@ -4,14 +4,20 @@
 
 import math
 
+from .._lazy_numpy import np
+
 from .. import const
 from .. import checker
+from ..converters import rgb_clamp_array, as_rgb_array
 from ..converters.brightness import calc_rgb as rgb_with_ratio
 from . import rgb_with_better_ratio, find_ratio
-from .criteria import threshold_criteria
+from . import rgb_with_better_ratio_many, find_ratio_many
+from . import broadcast_rgb_arrays
+from .criteria import threshold_criteria, BatchSearchCriteria, ToDarkerSide
 
 
-def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
+def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA,
+         fixed_luminance=None, other_luminance=None):
     """Try to find a color who has a satisfying contrast ratio.
 
     The color returned by this function will be created by changing
@@ -24,11 +30,18 @@ def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
     :type other_rgb: (int, int, int)
     :param level: "A", "AA" or "AAA" [optional]
     :type level: str
+    :param fixed_luminance: Relative luminance of fixed_rgb, if already
+                            known [optional]
+    :type fixed_luminance: float
+    :param other_luminance: Relative luminance of other_rgb, if already
+                            known [optional]
+    :type other_luminance: float
     :return: New RGB value whose brightness is adjusted from that of
              ``other_color``
     :rtype: (int, int, int)
     """
-    criteria = threshold_criteria(level, fixed_rgb, other_rgb)
+    criteria = threshold_criteria(level, fixed_rgb, other_rgb,
+                                  fixed_luminance, other_luminance)
     w = calc_upper_ratio_limit(other_rgb) / 2.0
 
     upper_rgb = _upper_limit_color(criteria, other_rgb, w * 2)
@@ -42,18 +55,212 @@ def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
                                  r, sufficient_r, rgb_with_ratio)
 
 
+# Number of the steps to refine the estimated ratio in find_analytic()
+_NEWTON_ITERATIONS = 2
+
+
+def find_analytic(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA,
+                  fixed_luminance=None, other_luminance=None):
+    """Try to find a color who has a satisfying contrast ratio, without
+    the generic binary search of find().
+
+    As brightness scales each RGB component linearly, the ratio that
+    gives the target luminance is estimated directly, and only a few
+    ratios around the estimate are checked on the grid of 0.1% steps
+    that find() rounds to.  The result is the color on that grid whose
+    contrast ratio is the closest to the target among those which
+    satisfy it.  When none of them does, the result of find() is
+    returned.  So the result is not always the same as that of find(),
+    whose binary search may stop at a passing color farther from the
+    target.
+    :param fixed_rgb: An RGB value which remains unchanged
+    :type fixed_rgb: (int, int, int)
+    :param other_rgb: An RGB value before the adjustment of brightness
+    :type other_rgb: (int, int, int)
+    :param level: "A", "AA" or "AAA" [optional]
+    :type level: str
+    :param fixed_luminance: Relative luminance of fixed_rgb, if already
+                            known [optional]
+    :type fixed_luminance: float
+    :param other_luminance: Relative luminance of other_rgb, if already
+                            known [optional]
+    :type other_luminance: float
+    :return: New RGB value whose brightness is adjusted from that of
+             ``other_color``
+    :rtype: (int, int, int)
+    """
+    criteria = threshold_criteria(level, fixed_rgb, other_rgb,
+                                  fixed_luminance, other_luminance)
+    upper_ratio = calc_upper_ratio_limit(other_rgb)
+
+    upper_rgb = _upper_limit_color(criteria, other_rgb, upper_ratio)
+    if upper_rgb:
+        return upper_rgb
+
+    fixed_luminance = criteria.fixed_luminance
+    target = criteria.target_contrast
+    to_darker_side = isinstance(criteria, ToDarkerSide)
+
+    def passes(k):
+        luminance = checker.relative_luminance(rgb_with_ratio(other_rgb,
+                                                              k / 10.0))
+        ratio = checker.luminance_to_contrast_ratio(fixed_luminance,
+                                                    luminance)
+
+        if to_darker_side:
+            return luminance <= fixed_luminance and ratio >= target
+
+        return luminance >= fixed_luminance and ratio >= target
+
+    # On the darker side the passing ratios are those up to the answer,
+    # and on the brighter side those from the answer.
+    max_k = upper_ratio * 10
+
+    if to_darker_side:
+        target_luminance = (fixed_luminance + 0.05) / target - 0.05
+        init_k = _estimate_k(other_rgb, target_luminance, max_k)
+        k = _first_true(lambda k: not passes(k), max_k, init_k) - 1
+    else:
+        target_luminance = target * (fixed_luminance + 0.05) - 0.05
+        init_k = _estimate_k(other_rgb, target_luminance, max_k)
+        k = _first_true(passes, max_k, init_k)
+
+    if 0 <= k <= max_k:
+        return rgb_with_ratio(other_rgb, k / 10.0)
+
+    return find(fixed_rgb, other_rgb, level,
+                criteria.fixed_luminance, criteria.other_luminance)
+
+
+def _estimate_k(rgb, target_luminance, max_k):
+    # Ratio in 0.1% that gives target_luminance if the RGB components
+    # were not rounded: a power of 2.2 approximating the conversion to
+    # linear RGB gives the initial value, which is refined by Newton's
+    # method.
+    if target_luminance <= 0:
+        return 0
+
+    weights = (0.2126, 0.7152, 0.0722)
+    gamma_luminance = sum(w * (c / 255.0) ** 2.2
+                          for (w, c) in zip(weights, rgb))
+
+    if gamma_luminance == 0:
+        return 0
+
+    s = (target_luminance / gamma_luminance) ** (1 / 2.2)
+
+    for _ in range(_NEWTON_ITERATIONS):
+        luminance = 0.0
+        slope = 0.0
+        for (w, c) in zip(weights, rgb):
+            x = c * s / 255.0
+            if x >= 1:
+                luminance += w
+            elif x <= 0.03928:
+                luminance += w * x / 12.92
+                slope += w * c / 255.0 / 12.92
+            else:
+                luminance += w * ((x + 0.055) / 1.055) ** 2.4
+                slope += (w * 2.4 * ((x + 0.055) / 1.055) ** 1.4 *
+                          c / 255.0 / 1.055)
+
+        if slope == 0:
+            break
+
+        s = min(max(s - (luminance - target_luminance) / slope, 0),
+                max_k / 1000.0)
+
+    return int(round(s * 1000))
+
+
+def _first_true(predicate, max_k, init_k):
+    # The smallest k in [0, max_k] for which predicate(k) holds, or
+    # max_k + 1, given that predicate(k) implies predicate(k + 1).
+    # The search gallops away from init_k and then bisects.
+    k = min(max(init_k, 0), max_k)
+    step = 1
+
+    if predicate(k):
+        hi = k
+        lo = hi - step
+        while lo >= 0 and predicate(lo):
+            hi = lo
+            step *= 2
+            lo = hi - step
+        lo = max(lo, -1)
+    else:
+        lo = k
+        hi = lo + step
+        while hi <= max_k and not predicate(hi):
+            lo = hi
+            step *= 2
+            hi = lo + step
+        hi = min(hi, max_k + 1)
+
+    # predicate(lo) is False or lo is -1, predicate(hi) is True or hi is
+    # max_k + 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if predicate(mid):
+            hi = mid
+        else:
+            lo = mid
+
+    return hi
+
+
+def find_many(fixed_rgbs, other_rgbs, level=checker.WCAGLevel.AA):
+    """Run find() for many pairs of colors at once.
+
+    The binary searches for all the pairs proceed in lock-step, and the
+    results are identical to those of find() applied to each pair.
+    :param fixed_rgbs: RGB values which remain unchanged, given as an
+                       array of shape (N, 3).  A single RGB value is
+                       used for all the rows.
+    :type fixed_rgbs: numpy.ndarray or list of (int, int, int)
+    :param other_rgbs: RGB values before the adjustment of brightness,
+                       given as an array of shape (N, 3)
+    :type other_rgbs: numpy.ndarray or list of (int, int, int)
+    :param level: "A", "AA" or "AAA" [optional]
+    :type level: str
+    :return: New RGB values whose brightness is adjusted from those of
+             ``other_rgbs``
+    :rtype: numpy.ndarray of uint8
+    """
+    (fixed_rgbs, other_rgbs) = broadcast_rgb_arrays(fixed_rgbs, other_rgbs)
+    criteria = BatchSearchCriteria(level, fixed_rgbs, other_rgbs)
+    w = calc_upper_ratio_limits(other_rgbs) / 2.0
+
+    ratios = find_ratio_many(other_rgbs, criteria, _rgbs_with_ratios, w, w)
+    (r, sufficient_r) = (criteria.round(ratios[0]), criteria.round(ratios[1]))
+    rgbs = rgb_with_better_ratio_many(other_rgbs, criteria,
+                                      r, sufficient_r, _rgbs_with_ratios)
+
+    limit_rgbs = _rgbs_with_ratios(other_rgbs, w * 2)
+    exceeding = ((criteria.other_luminances > criteria.fixed_luminances) &
+                 ~criteria.has_sufficient_contrast(limit_rgbs))
+    rgbs[exceeding] = limit_rgbs[exceeding]
+
+    return rgbs
+
+
+def _rgbs_with_ratios(rgbs, ratios):
+    # converters.brightness.calc_rgb_many() with a ratio for each row
+    return rgb_clamp_array(as_rgb_array(rgbs) * ratios[:, np.newaxis] / 100)
+
+
 def _upper_limit_color(criteria, other_rgb, max_ratio):
     limit_rgb = rgb_with_ratio(other_rgb, max_ratio)
 
-    if _exceed_upper_limit(criteria, other_rgb, limit_rgb):
+    if _exceed_upper_limit(criteria, limit_rgb):
         return limit_rgb
 
     return None
 
 
-def _exceed_upper_limit(criteria, other_rgb, limit_rgb):
-    other_luminance = checker.relative_luminance(other_rgb)
-    other_has_higher_luminance = other_luminance > criteria.fixed_luminance
+def _exceed_upper_limit(criteria, limit_rgb):
+    other_has_higher_luminance = (criteria.other_luminance >
+                                  criteria.fixed_luminance)
     sufficient_limit = criteria.has_sufficient_contrast(limit_rgb)
     return other_has_higher_luminance and not sufficient_limit
 
@@ -68,3 +275,11 @@ def calc_upper_ratio_limit(rgb):
 
     darkest = min(c for c in rgb if c != 0)
     return math.ceil((255.0 / darkest) * 100)
+
+
+def calc_upper_ratio_limits(rgbs):
+    """Return calc_upper_ratio_limit() of each row of an (N, 3) array."""
+    rgbs = np.asarray(rgbs)
+    darkest = np.where(rgbs == 0, 256, rgbs).min(1)
+    limits = np.ceil((255.0 / darkest) * 100)
+    return np.where((rgbs == 0).all(1), 100.0, limits)
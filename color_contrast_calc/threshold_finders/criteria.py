@@ -1,13 +1,22 @@
 import math
 
+from .._lazy_numpy import np
+
 from .. import checker
+from .. import const
 
 
 class SearchCriteria:
-    def __init__(self, level, fixed_rgb, math_round):
+    def __init__(self, level, fixed_rgb, math_round,
+                 fixed_luminance=None, other_luminance=None):
         self.level = level
         self.target_contrast = checker.level_to_ratio(level)
-        self.fixed_luminance = checker.relative_luminance(fixed_rgb)
+
+        if fixed_luminance is None:
+            fixed_luminance = checker.relative_luminance(fixed_rgb)
+
+        self.fixed_luminance = fixed_luminance
+        self.other_luminance = other_luminance
         self._math_round = math_round
 
     def round(self, ratio):
@@ -32,18 +41,122 @@ class ToBrighterSide(SearchCriteria):
         return self.target_contrast > contrast_ratio
 
 
-def threshold_criteria(level, fixed_rgb, other_rgb):
-    if should_scan_darker_side(fixed_rgb, other_rgb):
-        return ToDarkerSide(level, fixed_rgb, math.floor)
-
-    return ToBrighterSide(level, fixed_rgb, math.ceil)
+def threshold_criteria(level, fixed_rgb, other_rgb,
+                       fixed_luminance=None, other_luminance=None):
+    """Return the criteria of a threshold search.
+
+    The relative luminance of each color is calculated at most once and
+    kept in the returned criteria.  When it is already known, as for
+    instances of Color, it can be passed to skip the calculation.
+    :param level: "A", "AA" or "AAA"
+    :type level: str
+    :param fixed_rgb: An RGB value which remains unchanged
+    :type fixed_rgb: (int, int, int)
+    :param other_rgb: An RGB value to be adjusted
+    :type other_rgb: (int, int, int)
+    :param fixed_luminance: Relative luminance of fixed_rgb [optional]
+    :type fixed_luminance: float
+    :param other_luminance: Relative luminance of other_rgb [optional]
+    :type other_luminance: float
+    :return: Criteria of the search
+    :rtype: ToDarkerSide or ToBrighterSide
+    """
+    if fixed_luminance is None:
+        fixed_luminance = checker.relative_luminance(fixed_rgb)
+
+    if other_luminance is None:
+        other_luminance = checker.relative_luminance(other_rgb)
+
+    if _scan_darker_side(fixed_luminance, other_luminance):
+        return ToDarkerSide(level, fixed_rgb, math.floor,
+                            fixed_luminance, other_luminance)
+
+    return ToBrighterSide(level, fixed_rgb, math.ceil,
+                          fixed_luminance, other_luminance)
 
 
 def should_scan_darker_side(fixed_rgb, other_rgb):
     fixed_luminance = checker.relative_luminance(fixed_rgb)
     other_luminance = checker.relative_luminance(other_rgb)
+    return _scan_darker_side(fixed_luminance, other_luminance)
+
+
+def _scan_darker_side(fixed_luminance, other_luminance):
     higher_luminance = fixed_luminance > other_luminance
     same_luminance = fixed_luminance == other_luminance
-    is_light_color = checker.is_light_color(fixed_rgb)
 
-    return higher_luminance or (is_light_color and same_luminance)
+    return higher_luminance or (_is_light(fixed_luminance) and
+                                same_luminance)
+
+
+def _is_light(luminance):
+    # checker.is_light_color() for a color whose luminance is known
+    white = const.luminance.WHITE
+    black = const.luminance.BLACK
+    ratio_with_white = checker.luminance_to_contrast_ratio(white, luminance)
+    ratio_with_black = checker.luminance_to_contrast_ratio(black, luminance)
+    return ratio_with_white <= ratio_with_black
+
+
+class BatchSearchCriteria:
+    def __init__(self, level, fixed_rgbs, other_rgbs):
+        """Hold the criteria of threshold searches for many pairs of
+        colors at once.
+
+        Each row behaves as the ToDarkerSide or ToBrighterSide returned
+        by threshold_criteria() for the same pair.
+        :param level: "A", "AA" or "AAA"
+        :type level: str
+        :param fixed_rgbs: RGB values which remain unchanged, given as an
+                           array of shape (N, 3)
+        :type fixed_rgbs: numpy.ndarray or list of (int, int, int)
+        :param other_rgbs: RGB values to be adjusted, given as an array
+                           of shape (N, 3)
+        :type other_rgbs: numpy.ndarray or list of (int, int, int)
+        """
+        self.level = level
+        self.target_contrast = checker.level_to_ratio(level)
+        self.fixed_luminances = checker.relative_luminance_many(fixed_rgbs)
+        self.other_luminances = checker.relative_luminance_many(other_rgbs)
+        self.darker_side = scan_darker_side_mask(self.fixed_luminances,
+                                                 self.other_luminances)
+
+    def round(self, ratios):
+        ratios = np.asarray(ratios, dtype=np.float64) * 10
+        rounded = np.where(self.darker_side,
+                           np.floor(ratios), np.ceil(ratios))
+        return rounded / 10.0
+
+    def has_sufficient_contrast(self, rgbs, rows=slice(None)):
+        return self.contrast_ratios(rgbs, rows) >= self.target_contrast
+
+    def contrast_ratios(self, rgbs, rows=slice(None)):
+        luminances = checker.relative_luminance_many(rgbs)
+        return checker.luminances_to_contrast_ratios(
+            self.fixed_luminances[rows], luminances)
+
+    def increment_mask(self, contrast_ratios, rows=slice(None)):
+        target = self.target_contrast
+        return np.where(self.darker_side[rows],
+                        contrast_ratios > target, target > contrast_ratios)
+
+
+def scan_darker_side_mask(fixed_luminances, other_luminances):
+    """Return the decision of should_scan_darker_side() for many pairs.
+
+    :param fixed_luminances: Relative luminance of the fixed colors
+    :type fixed_luminances: numpy.ndarray
+    :param other_luminances: Relative luminance of the other colors
+    :type other_luminances: numpy.ndarray
+    :return: True for the rows to be searched on the darker side
+    :rtype: numpy.ndarray of bool
+    """
+    ratios_with_white = checker.luminances_to_contrast_ratios(
+        const.luminance.WHITE, fixed_luminances)
+    ratios_with_black = checker.luminances_to_contrast_ratios(
+        const.luminance.BLACK, fixed_luminances)
+    is_light_color = ratios_with_white <= ratios_with_black
+    higher_luminance = fixed_luminances > other_luminances
+    same_luminance = fixed_luminances == other_luminances
+
+    return higher_luminance | (is_light_color & same_luminance)
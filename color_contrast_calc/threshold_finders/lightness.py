@@ -2,14 +2,20 @@
 ``Color.find_lightness_threshold``.
 '''
 
+from .._lazy_numpy import np
+
 from .. import const
 from .. import checker
 from .. import utils
-from .criteria import threshold_criteria, should_scan_darker_side
+from .criteria import threshold_criteria, ToDarkerSide
+from .criteria import BatchSearchCriteria
 from . import rgb_with_better_ratio, find_ratio
+from . import rgb_with_better_ratio_many, find_ratio_many
+from . import broadcast_rgb_arrays
 
 
-def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
+def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA,
+         fixed_luminance=None, other_luminance=None):
     """Try to find a color who has a satisfying contrast ratio.
 
     The color returned by this function will be created by changing
@@ -22,14 +28,21 @@ def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
     :type other_rgb: (int, int, int)
     :param level: "A", "AA" or "AAA" [optional]
     :type level: str
+    :param fixed_luminance: Relative luminance of fixed_rgb, if already
+                            known [optional]
+    :type fixed_luminance: float
+    :param other_luminance: Relative luminance of other_rgb, if already
+                            known [optional]
+    :type other_luminance: float
     :return: New RGB value whose lightness is adjusted from that of
              ``other_color``
     :rtype: (int, int, int)
     """
-    criteria = threshold_criteria(level, fixed_rgb, other_rgb)
+    criteria = threshold_criteria(level, fixed_rgb, other_rgb,
+                                  fixed_luminance, other_luminance)
     other_hsl = utils.rgb_to_hsl(other_rgb)
-    max_, min_ = _determine_minmax(fixed_rgb, other_rgb, other_hsl[2])
-    boundary_rgb = _lightness_boundary_rgb(fixed_rgb, max_, min_, criteria)
+    max_, min_ = _determine_minmax(criteria, other_hsl[2])
+    boundary_rgb = _lightness_boundary_rgb(max_, min_, criteria)
 
     if boundary_rgb:
         return boundary_rgb
@@ -41,6 +54,55 @@ def find(fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
                                  last_l, sufficient_l, rgb_with_ratio)
 
 
+def find_many(fixed_rgbs, other_rgbs, level=checker.WCAGLevel.AA):
+    """Run find() for many pairs of colors at once.
+
+    The binary searches for all the pairs proceed in lock-step, and the
+    results are identical to those of find() applied to each pair.
+    :param fixed_rgbs: RGB values which remain unchanged, given as an
+                       array of shape (N, 3).  A single RGB value is
+                       used for all the rows.
+    :type fixed_rgbs: numpy.ndarray or list of (int, int, int)
+    :param other_rgbs: RGB values before the adjustment of lightness,
+                       given as an array of shape (N, 3)
+    :type other_rgbs: numpy.ndarray or list of (int, int, int)
+    :param level: "A", "AA" or "AAA" [optional]
+    :type level: str
+    :return: New RGB values whose lightness is adjusted from those of
+             ``other_rgbs``
+    :rtype: numpy.ndarray of uint8
+    """
+    (fixed_rgbs, other_rgbs) = broadcast_rgb_arrays(fixed_rgbs, other_rgbs)
+    criteria = BatchSearchCriteria(level, fixed_rgbs, other_rgbs)
+    other_hsls = utils.rgb_to_hsl_array(other_rgbs)
+    init_l = other_hsls[:, 2]
+
+    # (max, min) as in _determine_minmax()
+    max_ = np.where(criteria.darker_side, init_l, 100)
+    min_ = np.where(criteria.darker_side, 0, init_l)
+
+    last_l, sufficient_l = find_ratio_many(other_hsls, criteria,
+                                           _rgbs_with_ratios,
+                                           (max_ + min_) / 2.0, max_ - min_)
+    rgbs = rgb_with_better_ratio_many(other_hsls, criteria,
+                                      last_l, sufficient_l,
+                                      _rgbs_with_ratios)
+
+    # The boundary colors as in _lightness_boundary_rgb()
+    fixed_luminances = criteria.fixed_luminances
+    target = criteria.target_contrast
+    with_white = checker.luminances_to_contrast_ratios(
+        const.luminance.WHITE, fixed_luminances)
+    with_black = checker.luminances_to_contrast_ratios(
+        const.luminance.BLACK, fixed_luminances)
+    to_white = (max_ == 100) & (with_white < target)
+    to_black = (min_ == 0) & (with_black < target)
+    rgbs[to_white] = const.rgb.WHITE
+    rgbs[to_black] = const.rgb.BLACK
+
+    return rgbs
+
+
 def rgb_with_ratio(hsl, ratio):
     if hsl[2] != ratio:
         hsl = hsl[0:2] + (ratio,)
@@ -48,26 +110,33 @@ def rgb_with_ratio(hsl, ratio):
     return utils.hsl_to_rgb(hsl)
 
 
-def _determine_minmax(fixed_rgb, other_rgb, init_l):
-    scan_darker_side = should_scan_darker_side(fixed_rgb, other_rgb)
+def _rgbs_with_ratios(hsls, ratios):
+    # rgb_with_ratio() of each row with a ratio for each row
+    hsls = np.array(hsls, dtype=np.float64)
+    hsls[:, 2] = ratios
+    return utils.hsl_to_rgb_array(hsls)
+
+
+def _determine_minmax(criteria, init_l):
+    scan_darker_side = isinstance(criteria, ToDarkerSide)
 
     return (init_l, 0) if scan_darker_side else (100, init_l)  # (max, min)
 
 
-def _lightness_boundary_rgb(rgb, max_, min_, criteria):
+def _lightness_boundary_rgb(max_, min_, criteria):
     black = const.luminance.BLACK
     white = const.luminance.WHITE
 
-    if min_ == 0 and not _has_sufficient_contrast(black, rgb, criteria):
+    if min_ == 0 and not _has_sufficient_contrast(black, criteria):
         return const.rgb.BLACK
 
-    if max_ == 100 and not _has_sufficient_contrast(white, rgb, criteria):
+    if max_ == 100 and not _has_sufficient_contrast(white, criteria):
         return const.rgb.WHITE
 
     return None
 
 
-def _has_sufficient_contrast(ref_luminance, rgb, criteria):
-    luminance = checker.relative_luminance(rgb)
+def _has_sufficient_contrast(ref_luminance, criteria):
+    luminance = criteria.fixed_luminance
     ratio = checker.luminance_to_contrast_ratio(ref_luminance, luminance)
     return ratio >= criteria.target_contrast
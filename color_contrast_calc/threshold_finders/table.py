@@ -0,0 +1,294 @@
+'''Provide ThresholdTable that holds the results of a threshold finder
+for every foreground color against one background.
+
+Tables are optional.  Once registered with register(), a table is
+consulted by ``Color.find_brightness_threshold`` and
+``Color.find_lightness_threshold`` before they fall back to the search.
+A table is built lazily, 65536 foreground colors sharing the same red
+value at a time.  As building a part takes a few tenths of a second,
+the parts needed by Color are built in a background thread while the
+search answers in the meantime, and register() can start building the
+whole table in the background.  The built part can be saved to a .npz
+file and loaded later.
+'''
+
+import os
+import queue
+import threading
+
+from .._lazy_numpy import np
+
+from .. import checker
+from .. import utils
+from . import brightness
+from . import lightness
+
+
+_FINDERS = {
+    'brightness': brightness,
+    'lightness': lightness,
+}
+
+_TABLES = {}
+
+
+class ThresholdTable:
+    PLANE_SIZE = 1 << 16
+
+    def __init__(self, fixed_rgb, level=checker.WCAGLevel.AA,
+                 kind='lightness', cache_path=None):
+        """Create a table of the threshold colors against a background.
+
+        :param fixed_rgb: RGB value of the background
+        :type fixed_rgb: (int, int, int)
+        :param level: "A", "AA" or "AAA" [optional]
+        :type level: str
+        :param kind: "brightness" or "lightness" [optional]
+        :type kind: str
+        :param cache_path: Path to a .npz file.  If the file exists, the
+                           results stored in it are loaded. [optional]
+        :type cache_path: str
+        """
+        if kind not in _FINDERS:
+            raise ValueError('Unknown kind of table: {}'.format(kind))
+
+        self.fixed_rgb = tuple(fixed_rgb)
+        self.target_contrast = checker.level_to_ratio(level)
+        self.kind = kind
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._scheduled = set()
+        self._queue = queue.Queue()
+        self._worker = None
+
+        if cache_path is not None and os.path.exists(cache_path):
+            (self.results, self.built) = self._load(cache_path)
+        else:
+            self.results = np.zeros((256, self.PLANE_SIZE, 3), dtype=np.uint8)
+            self.built = np.zeros(256, dtype=bool)
+
+    def lookup(self, other_rgb):
+        """Return the threshold color for a foreground color.
+
+        The result is identical to that of the finder.
+        :param other_rgb: RGB value of the foreground color
+        :type other_rgb: (int, int, int)
+        :return: Threshold color
+        :rtype: (int, int, int)
+        """
+        (r, g, b) = other_rgb
+
+        if not self.built[r]:
+            self._build_plane(r)
+
+        return tuple(self.results[r, (g << 8) | b].tolist())
+
+    def lookup_nowait(self, other_rgb):
+        """Return the threshold color if the table already has it.
+
+        Otherwise the part of the table for the color is scheduled to be
+        built in a background thread, and None is returned.
+        :param other_rgb: RGB value of the foreground color
+        :type other_rgb: (int, int, int)
+        :return: Threshold color or None
+        :rtype: (int, int, int) or None
+        """
+        (r, g, b) = other_rgb
+
+        if not self.built[r]:
+            self._schedule_plane(r)
+            return None
+
+        return tuple(self.results[r, (g << 8) | b].tolist())
+
+    def lookup_many(self, other_rgbs):
+        """Return the threshold colors for many foreground colors.
+
+        :param other_rgbs: RGB values given as an array of shape (N, 3)
+        :type other_rgbs: numpy.ndarray or list of (int, int, int)
+        :return: Threshold colors
+        :rtype: numpy.ndarray of uint8
+        """
+        packed = utils.rgb_array_to_int(other_rgbs)
+        reds = packed >> 16
+
+        for r in np.unique(reds).tolist():
+            if not self.built[r]:
+                self._build_plane(r)
+
+        return self.results[reds, packed & 0xffff]
+
+    def build(self):
+        """Build the parts of the table that are not built yet."""
+        for r in range(256):
+            if not self.built[r]:
+                self._build_plane(r)
+
+    def build_in_background(self):
+        """Build the parts of the table that are not built yet in a
+        background thread.
+        """
+        for r in range(256):
+            if not self.built[r]:
+                self._schedule_plane(r)
+
+    def join(self):
+        """Wait until the parts scheduled to be built are built."""
+        self._queue.join()
+
+    def save(self, cache_path=None):
+        """Save the table to a .npz file.
+
+        :param cache_path: Path to the file, cache_path of the table by
+                           default [optional]
+        :type cache_path: str
+        """
+        cache_path = cache_path or self.cache_path
+
+        if cache_path is None:
+            raise ValueError('No path to save the table')
+
+        # As in LuminanceIndex, a temporary file is renamed so that
+        # other processes never see a partially written file.
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+
+        with self._lock:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, fixed_rgb=np.array(self.fixed_rgb),
+                         target_contrast=self.target_contrast,
+                         kind=self.kind, results=self.results,
+                         built=self.built)
+
+        os.replace(tmp_path, cache_path)
+
+    def _build_plane(self, r):
+        if self.built[r]:
+            return
+
+        # The search runs without the lock, so that lookups and save() are
+        # not kept waiting.  Two threads may build the same plane, but they
+        # write the same results.
+        finder = _FINDERS[self.kind]
+        plane = finder.find_many(self.fixed_rgb, _plane_rgbs(r),
+                                 self.target_contrast)
+
+        with self._lock:
+            self.results[r] = plane
+            self.built[r] = True
+
+    def _schedule_plane(self, r):
+        with self._schedule_lock:
+            if r in self._scheduled:
+                return
+
+            self._scheduled.add(r)
+            self._queue.put(r)
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work)
+                self._worker.daemon = True
+                self._worker.start()
+
+    def _work(self):
+        while True:
+            r = self._queue.get()
+            try:
+                self._build_plane(r)
+            except Exception:
+                # Let a later lookup schedule the plane again.
+                with self._schedule_lock:
+                    self._scheduled.discard(r)
+            finally:
+                self._queue.task_done()
+
+    def _load(self, cache_path):
+        with np.load(cache_path) as data:
+            matches = (tuple(data['fixed_rgb'].tolist()) == self.fixed_rgb and
+                       float(data['target_contrast']) ==
+                       self.target_contrast and
+                       str(data['kind']) == self.kind)
+
+            if not matches:
+                raise ValueError('{} is not a table for {}'.format(
+                    cache_path, (self.fixed_rgb, self.target_contrast,
+                                 self.kind)))
+
+            return (data['results'].copy(), data['built'].copy())
+
+
+def register(fixed_rgb, level=checker.WCAGLevel.AA, kind='lightness',
+             cache_path=None, background=False):
+    """Create a table and let Color.find_*_threshold consult it.
+
+    Until the part of the table for a foreground color is built,
+    Color.find_*_threshold searches the threshold as usual, and the part
+    is built in a background thread.
+
+    :param fixed_rgb: RGB value of the background
+    :type fixed_rgb: (int, int, int)
+    :param level: "A", "AA" or "AAA" [optional]
+    :type level: str
+    :param kind: "brightness" or "lightness" [optional]
+    :type kind: str
+    :param cache_path: Path to a .npz file [optional]
+    :type cache_path: str
+    :param background: If set to True, the whole table starts to be
+                       built in a background thread [optional]
+    :type background: bool
+    :return: Registered table
+    :rtype: ThresholdTable
+    """
+    table = ThresholdTable(fixed_rgb, level, kind, cache_path)
+    _TABLES[(table.kind, table.fixed_rgb, table.target_contrast)] = table
+
+    if background:
+        table.build_in_background()
+
+    return table
+
+
+def unregister(fixed_rgb, level=checker.WCAGLevel.AA, kind='lightness'):
+    """Stop consulting the table registered for a background."""
+    key = (kind, tuple(fixed_rgb), checker.level_to_ratio(level))
+    _TABLES.pop(key, None)
+
+
+def unregister_all():
+    """Stop consulting any of the registered tables."""
+    _TABLES.clear()
+
+
+def lookup(kind, fixed_rgb, other_rgb, level=checker.WCAGLevel.AA):
+    """Look up the threshold color in a registered table.
+
+    :param kind: "brightness" or "lightness"
+    :type kind: str
+    :param fixed_rgb: RGB value of the background
+    :type fixed_rgb: (int, int, int)
+    :param other_rgb: RGB value of the foreground color
+    :type other_rgb: (int, int, int)
+    :param level: "A", "AA" or "AAA" [optional]
+    :type level: str
+    :return: Threshold color, or None if no table is registered or the
+             table does not have the color yet
+    :rtype: (int, int, int) or None
+    """
+    if not _TABLES:
+        return None
+
+    key = (kind, tuple(fixed_rgb), checker.level_to_ratio(level))
+    table = _TABLES.get(key)
+
+    if table is None:
+        return None
+
+    return table.lookup_nowait(other_rgb)
+
+
+def _plane_rgbs(r):
+    rgbs = np.empty((ThresholdTable.PLANE_SIZE, 3), dtype=np.intp)
+    rgbs[:, 0] = r
+    rgbs[:, 1] = np.repeat(np.arange(256), 256)
+    rgbs[:, 2] = np.tile(np.arange(256), 256)
+    return rgbs
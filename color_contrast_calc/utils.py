@@ -4,12 +4,16 @@ This module provides basic operations on colors given as RGB values
 (including their hex code presentations) or HSL values.
 '''
 
-from functools import reduce
+from functools import reduce, lru_cache
 from numbers import Number
 import re
 
+from ._lazy_numpy import np
+
 _HEX_RE = re.compile(r'\A#?[0-9a-f]{3}([0-9a-f]{3})?\Z', re.IGNORECASE)
 
+_HEX_DIGITS = '0123456789abcdef'
+
 
 def hex_to_rgb(hex_code):
     """Convert a hex color code string to a RGB value.
@@ -41,6 +45,161 @@ def rgb_to_hex(rgb):
     return '#{:02x}{:02x}{:02x}'.format(*rgb)
 
 
+def hex_to_rgb_array(hex_codes):
+    """Convert many hex color codes to RGB values at once.
+
+    Unlike hex_to_rgb(), the validity of each code is checked as well,
+    in the same way as is_valid_hex().
+    :param hex_codes: Hex color codes such as "#ffff00", "#ff0" or
+                      "FFFF00"
+    :type hex_codes: list of str or numpy.ndarray of str
+    :return: RGB values as an array of shape (N, 3), and a mask that is
+             True for each valid code.  The RGB value of an invalid
+             code is (0, 0, 0).
+    :rtype: (numpy.ndarray of uint8, numpy.ndarray of bool)
+    """
+    tables = _hex_tables()
+    codes = np.ascontiguousarray(hex_codes, dtype=np.str_).reshape(-1)
+    n = len(codes)
+    width = codes.itemsize // np.dtype('U1').itemsize
+    chars = codes.view(np.uint32).reshape(n, width)
+
+    has_sharp = chars[:, 0] == ord('#')
+    n_digits = np.char.str_len(codes) - has_sharp
+    is_short = n_digits == 3
+    positions = np.where(is_short[:, np.newaxis],
+                         tables['short_positions'], tables['long_positions'])
+    positions = np.minimum(positions + has_sharp[:, np.newaxis], width - 1)
+    digits = chars[np.arange(n)[:, np.newaxis], positions]
+    values = tables['digit_values'][np.minimum(digits, 127)]
+
+    valid = (is_short | (n_digits == 6)) & (values != 255).all(1)
+    values[~valid] = 0
+
+    return (values[:, 0::2] * 16 + values[:, 1::2], valid)
+
+
+def rgb_array_to_hex(rgbs):
+    """Convert many RGB values to hex color codes at once.
+
+    :param rgbs: RGB values given as an array of shape (N, 3) or a list
+                 of tuples of integers
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :return: Hex color codes such as "#ffff00"
+    :rtype: list of str
+    """
+    rgbs = np.asarray(rgbs, dtype=np.uint8).reshape(-1, 3)
+    chars = np.empty((len(rgbs), 7), dtype=np.uint8)
+    chars[:, 0] = ord('#')
+    digit_chars = _hex_tables()['digit_chars']
+    chars[:, 1::2] = digit_chars[rgbs >> 4]
+    chars[:, 2::2] = digit_chars[rgbs & 0xf]
+
+    return chars.view('S7').reshape(-1).astype(np.str_).tolist()
+
+
+@lru_cache(maxsize=None)
+def _hex_tables():
+    # Value of each ASCII character as a hex digit, 255 for non-digits
+    digit_values = np.full(128, 255, dtype=np.uint8)
+    for (i, c) in enumerate(_HEX_DIGITS):
+        digit_values[ord(c)] = digit_values[ord(c.upper())] = i
+
+    return {
+        'digit_values': digit_values,
+        'digit_chars': np.frombuffer(_HEX_DIGITS.encode('ascii'),
+                                     dtype=np.uint8),
+        # Positions of the digits for (r, r, g, g, b, b) in "rrggbb"
+        # and "rgb"
+        'long_positions': np.arange(6),
+        'short_positions': np.array([0, 0, 1, 1, 2, 2]),
+    }
+
+
+def rgb_to_int(rgb):
+    """Convert a RGB value to a packed 24-bit integer.
+
+    :param rgb: RGB value represented as a tuple of integers
+    :type rgb: (int, int, int)
+    :return: Integer such as 0xffff00
+    :rtype: int
+    """
+    (r, g, b) = rgb
+
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+        raise ValueError('RGB value out of the range of 0 to 255: {}'.format(
+            rgb))
+
+    return (r << 16) | (g << 8) | b
+
+
+def int_to_rgb(packed):
+    """Convert a packed 24-bit integer to a RGB value.
+
+    :param packed: Integer such as 0xffff00
+    :type packed: int
+    :return: RGB value represented as a tuple of integers
+    :rtype: (int, int, int)
+    """
+    _check_packed(packed)
+    return ((packed >> 16) & 0xff, (packed >> 8) & 0xff, packed & 0xff)
+
+
+def hex_to_int(hex_code):
+    """Convert a hex color code to a packed 24-bit integer.
+
+    :param hex_code: Hex color code such as "#ffff00" or "#ff0"
+    :type hex_code: str
+    :return: Integer such as 0xffff00
+    :rtype: int
+    """
+    return int(normalize_hex(hex_code, False), 16)
+
+
+def int_to_hex(packed):
+    """Convert a packed 24-bit integer to a hex color code.
+
+    :param packed: Integer such as 0xffff00
+    :type packed: int
+    :return: Hex color code such as "#ffff00"
+    :rtype: str
+    """
+    _check_packed(packed)
+    return '#{:06x}'.format(packed)
+
+
+def _check_packed(packed):
+    if not 0 <= packed <= 0xffffff:
+        raise ValueError(
+            'Integer out of the range of 0 to 0xffffff: {}'.format(packed))
+
+
+def rgb_array_to_int(rgbs):
+    """Convert RGB values to packed 24-bit integers.
+
+    :param rgbs: RGB values given as an array of shape (N, 3) or a list
+                 of tuples of integers
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :return: Integers such as 0xffff00
+    :rtype: numpy.ndarray of uint32
+    """
+    rgbs = np.asarray(rgbs, dtype=np.uint32).reshape(-1, 3)
+    return (rgbs[:, 0] << 16) | (rgbs[:, 1] << 8) | rgbs[:, 2]
+
+
+def int_array_to_rgb(packed):
+    """Convert packed 24-bit integers to RGB values.
+
+    :param packed: Integers such as 0xffff00
+    :type packed: numpy.ndarray or list of int
+    :return: RGB values as an array of shape (N, 3)
+    :rtype: numpy.ndarray of uint8
+    """
+    packed = np.asarray(packed, dtype=np.uint32).reshape(-1, 1)
+    return ((packed >> np.array([16, 8, 0], dtype=np.uint32)) &
+            0xff).astype(np.uint8)
+
+
 def normalize_hex(code, prefix=True):
     """Normalize a hex color code to a 6 digits, lowercased one.
 
@@ -84,6 +243,37 @@ def hsl_to_rgb(hsl):
     return tuple(round(_hue_to_rgb(m1, m2, ah) * 255) for ah in adjusted_h)
 
 
+def hsl_to_rgb_array(hsls):
+    """Convert many HSL values to RGB values at once.
+
+    The results are identical to those of hsl_to_rgb().
+    :param hsls: HSL values given as an array of shape (N, 3) or a list
+                 of tuples of numbers
+    :type hsls: numpy.ndarray or list of (float, float, float)
+    :return: RGB values as an array of shape (N, 3)
+    :rtype: numpy.ndarray of uint8
+    """
+    hsls = np.asarray(hsls, dtype=np.float64).reshape(-1, 3)
+    h, s, l = (hsls[:, i] / u for (i, u) in enumerate((360.0, 100.0, 100.0)))
+
+    m2 = np.where(l <= 0.5, l * (s + 1), l + s - l * s)[:, np.newaxis]
+    m1 = l[:, np.newaxis] * 2 - m2
+
+    adjusted_h = np.stack((h + 1 / 3.0, h, h - 1 / 3.0), axis=1)
+    rgbs = np.round(_hue_to_rgb_array(m1, m2, adjusted_h) * 255)
+    return rgbs.astype(np.uint8)
+
+
+def _hue_to_rgb_array(m1, m2, h):
+    h = np.where(h < 0, h + 1, h)
+    h = np.where(h > 1, h - 1, h)
+    return np.select([h * 6 < 1, h * 2 < 1, h * 3 < 2],
+                     [m1 + (m2 - m1) * h * 6,
+                      m2 + 0 * h,
+                      m1 + (m2 - m1) * (2 / 3.0 - h) * 6],
+                     m1 + 0 * h)
+
+
 def _hue_to_rgb(m1, m2, h):
     if h < 0:
         h += 1
@@ -136,6 +326,41 @@ def rgb_to_hsl(rgb):
             _rgb_to_lightness(rgb) * 100)
 
 
+def rgb_to_hsl_array(rgbs):
+    """Convert many RGB values to HSL values at once.
+
+    The results are identical to those of rgb_to_hsl().
+    :param rgbs: RGB values given as an array of shape (N, 3) or a list
+                 of tuples of integers
+    :type rgbs: numpy.ndarray or list of (int, int, int)
+    :return: HSL values as an array of shape (N, 3)
+    :rtype: numpy.ndarray of float64
+    """
+    rgbs = np.asarray(rgbs, dtype=np.int64).reshape(-1, 3)
+    n = len(rgbs)
+    max_c = rgbs.max(1)
+    min_c = rgbs.min(1)
+    is_gray = max_c == min_c
+    d = np.where(is_gray, 1, max_c - min_c).astype(np.float64)
+
+    lightness = (max_c + min_c) / 510.0
+    saturation = np.where(lightness <= 0.5,
+                          d / np.where(is_gray, 1, max_c + min_c),
+                          d / np.where(is_gray, 1, 510 - max_c - min_c))
+
+    # Like the reduce() in _rgb_to_hue(), the last of the largest
+    # components is chosen when some of them are equal.
+    mi = 2 - rgbs[:, ::-1].argmax(1)
+    rows = np.arange(n)
+    h = mi * 120 + (rgbs[rows, (mi + 1) % 3] -
+                    rgbs[rows, (mi + 2) % 3]) * 60 / d
+    h = np.where(h < 0, h + 360, h)
+
+    return np.stack((np.where(is_gray, 0.0, h),
+                     np.where(is_gray, 0.0, saturation) * 100,
+                     lightness * 100), axis=1)
+
+
 def _rgb_to_lightness(rgb):
     return (max(rgb) + min(rgb)) / 510.0
 
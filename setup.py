@@ -18,7 +18,6 @@ setup(
     author_email='hashimoto.naoki@gmail.com',
     license='MIT',
     classifier=[
-        'Programming Language :: Python :: 3.2',
         'Programming Language :: Python :: 3.3',
         'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
@@ -26,9 +25,9 @@ setup(
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3 :: Only',
     ],
-    python_requires='~=3.2',
+    python_requires='~=3.3',
     install_requires=[
-        'numpy>=1.3',
+        'numpy>=1.10',
     ],
     extras_requires={
         'dev': ['pytest'],
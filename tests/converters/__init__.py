@@ -0,0 +1,36 @@
+import numpy as np
+
+
+def sample_rgbs():
+    """Return a grid of RGB values and random ones as an array."""
+    grid = [(r, g, b) for r in range(0, 256, 51)
+            for g in range(0, 256, 51) for b in range(0, 256, 51)]
+    random_rgbs = np.random.RandomState(0).randint(0, 256, (1000, 3))
+    return np.concatenate((grid, random_rgbs))
+
+
+def assert_calc_rgb_many(test_case, converter, ratios):
+    """Check that converter.calc_rgb_many() returns the same values as
+    converter.calc_rgb() for each of ratios.
+    """
+    rgbs = sample_rgbs()
+
+    for ratio in ratios:
+        expected = [converter.calc_rgb(rgb, ratio) for rgb in rgbs.tolist()]
+        new_rgbs = converter.calc_rgb_many(rgbs, ratio)
+
+        test_case.assertEqual(new_rgbs.dtype, np.uint8)
+        test_case.assertEqual([tuple(rgb) for rgb in new_rgbs.tolist()],
+                              expected)
+
+
+def assert_matrix_cache_info(test_case, converter):
+    """Check that the matrix of converter is reused for the same ratio."""
+    converter.calc_rgb((255, 165, 0), 33.5)
+    info = converter.matrix_cache_info()
+    converter.calc_rgb((0, 0, 255), 33.5)
+    new_info = converter.matrix_cache_info()
+
+    test_case.assertEqual(new_info.hits, info.hits + 1)
+    test_case.assertEqual(new_info.misses, info.misses)
+    test_case.assertLessEqual(new_info.currsize, new_info.maxsize)
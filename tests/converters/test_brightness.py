@@ -1,5 +1,6 @@
 import unittest
 from color_contrast_calc.converters import brightness
+from . import assert_calc_rgb_many
 
 class TestBrightness(unittest.TestCase):
     def setup(self):
@@ -28,3 +29,6 @@ class TestBrightness(unittest.TestCase):
         self.assertEqual(brightness.calc_rgb(yellow, 120), yellow)
 
         self.assertEqual(brightness.calc_rgb(orange, 40.3), (103, 66, 0))
+
+    def test_calc_rgb_many(self):
+        assert_calc_rgb_many(self, brightness, (0, 40.3, 60, 100, 120, 250))
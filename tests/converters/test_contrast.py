@@ -1,5 +1,6 @@
 import unittest
 from color_contrast_calc.converters import contrast
+from . import assert_calc_rgb_many
 
 class TestContrast(unittest.TestCase):
     def setup(self):
@@ -21,3 +22,6 @@ class TestContrast(unittest.TestCase):
 
         self.assertEqual(contrast.calc_rgb(orange, 60), (204, 150, 51))
         self.assertEqual(contrast.calc_rgb(orange, 120), (255, 173, 0))
+
+    def test_calc_rgb_many(self):
+        assert_calc_rgb_many(self, contrast, (0, 30, 50, 100, 130, 250))
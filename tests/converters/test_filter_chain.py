@@ -0,0 +1,117 @@
+import math
+import unittest
+import numpy as np
+from color_contrast_calc.converters import brightness
+from color_contrast_calc.converters import hue_rotate
+from color_contrast_calc.converters import saturate
+from color_contrast_calc.converters.filter_chain import FilterChain
+from color_contrast_calc.converters.filter_chain import parse_filter
+
+_grid = [(r, g, b) for r in range(0, 256, 51)
+         for g in range(0, 256, 51) for b in range(0, 256, 51)]
+
+class TestFilterChain(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def test_parse_filter(self):
+        self.assertEqual(parse_filter('brightness(120%) saturate(0.8)'),
+                         [('brightness', 120), ('saturate', 80)])
+        self.assertEqual(parse_filter('Hue-Rotate(0.5turn) hue-rotate(30)'),
+                         [('hue-rotate', 180), ('hue-rotate', 30)])
+        self.assertEqual(parse_filter('hue-rotate(-100grad)'),
+                         [('hue-rotate', -90)])
+        self.assertAlmostEqual(parse_filter('hue-rotate(3.14159rad)')[0][1],
+                               3.14159 * 180 / math.pi)
+        self.assertEqual(parse_filter('invert() grayscale( 50% ) contrast()'),
+                         [('invert', 100), ('grayscale', 50),
+                          ('contrast', 100)])
+        self.assertEqual(parse_filter('none'), [])
+        self.assertEqual(parse_filter('invert(150%) grayscale(2)'),
+                         [('invert', 100), ('grayscale', 100)])
+
+        for invalid in ('blur(2px)', 'brightness(120deg)', 'saturate(-1)',
+                        'hue-rotate(10%)', 'brightness(120%) foo',
+                        'brightness(abc)', '', '  '):
+            with self.assertRaises(ValueError):
+                parse_filter(invalid)
+
+    def test_calc_rgb(self):
+        orange = (255, 165, 0)
+        chain = FilterChain('brightness(120%) saturate(80%) hue-rotate(30deg)')
+        expected = hue_rotate.calc_rgb(
+            saturate.calc_rgb(brightness.calc_rgb(orange, 120), 80), 30)
+
+        self.assertEqual(chain.calc_rgb(orange), expected)
+
+        chain = FilterChain([(brightness, 120), ('saturate', 80),
+                             ('hue_rotate', 30)])
+        self.assertEqual(chain.calc_rgb(orange), expected)
+
+        self.assertEqual(FilterChain('none').calc_rgb(orange), orange)
+
+    def test_invalid_steps(self):
+        for steps in ([('brightness', -50)], [(saturate, -1)],
+                      [('invert', float('nan'))], ''):
+            with self.assertRaises(ValueError):
+                FilterChain(steps)
+
+        chain = FilterChain([('hue-rotate', -30)])
+        self.assertEqual(chain.steps, ((hue_rotate, -30.0),))
+
+    def test_amount_over_100(self):
+        gray = (100, 100, 100)
+        black = (0, 0, 0)
+
+        for round_each_step in (True, False):
+            chain = FilterChain('invert(150%)', round_each_step)
+            self.assertEqual(chain.steps[0][1], 100)
+            self.assertEqual(chain.calc_rgb(gray), (155, 155, 155))
+            self.assertEqual(chain.calc_rgb(black), (255, 255, 255))
+            self.assertEqual(chain.calc_rgb_many([black]).tolist(),
+                             [[255, 255, 255]])
+
+            chain = FilterChain([('invert', 150), ('grayscale', 300)],
+                                round_each_step)
+            self.assertEqual(chain.steps, FilterChain(
+                [('invert', 100), ('grayscale', 100)]).steps)
+
+    def test_calc_rgb_many(self):
+        css_filters = ['brightness(120%) saturate(80%) hue-rotate(30deg)',
+                       'contrast(70%) invert(20%) grayscale(30%)',
+                       'hue-rotate(200deg) saturate(250%) brightness(0.6)',
+                       'none']
+
+        for css_filter in css_filters:
+            chain = FilterChain(css_filter)
+            rgbs = chain.calc_rgb_many(_grid)
+
+            self.assertEqual(rgbs.dtype, np.uint8)
+            self.assertEqual([tuple(rgb) for rgb in rgbs.tolist()],
+                             [chain.calc_rgb(rgb) for rgb in _grid])
+
+    def test_without_rounding_each_step(self):
+        css_filters = ['brightness(80%) saturate(80%) grayscale(20%)',
+                       'brightness(120%) saturate(80%) hue-rotate(30deg)',
+                       'hue-rotate(200deg) saturate(250%) contrast(130%)']
+
+        for css_filter in css_filters:
+            chain = FilterChain(css_filter, round_each_step=False)
+            expected = np.array(_grid, dtype=np.float64)
+
+            for (name, amount) in parse_filter(css_filter):
+                single_step = FilterChain([(name, amount)], False)
+                (matrix, offset) = single_step._segments[0]
+                expected = np.clip(expected.dot(matrix.T) + offset, 0, 255)
+
+            rgbs = chain.calc_rgb_many(_grid).astype(np.float64)
+            self.assertTrue((np.abs(rgbs - expected) <= 0.5 + 1e-9).all())
+            self.assertEqual(chain.calc_rgb(_grid[7]), tuple(rgbs[7]))
+
+        chain = FilterChain('brightness(80%) saturate(80%) grayscale(20%)',
+                            round_each_step=False)
+        self.assertEqual(len(chain._segments), 1)
+
+        chain = FilterChain('brightness(120%) saturate(80%) hue-rotate(30deg)',
+                            round_each_step=False)
+        self.assertEqual(len(chain._segments), 2)
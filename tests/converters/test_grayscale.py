@@ -1,5 +1,6 @@
 import unittest
 from color_contrast_calc.converters import grayscale
+from . import assert_calc_rgb_many, assert_matrix_cache_info
 
 class TestGrayscale(unittest.TestCase):
     def setup(self):
@@ -20,3 +21,9 @@ class TestGrayscale(unittest.TestCase):
         r = 50
         self.assertEqual(grayscale.calc_rgb(yellow, r), (246, 246, 118))
         self.assertEqual(grayscale.calc_rgb(orange, r), (214, 169 ,86))
+
+    def test_calc_rgb_many(self):
+        assert_calc_rgb_many(self, grayscale, list(range(0, 121, 10)) + [33.3])
+
+    def test_matrix_cache_info(self):
+        assert_matrix_cache_info(self, grayscale)
@@ -1,5 +1,6 @@
 import unittest
 from color_contrast_calc.converters import hue_rotate
+from . import assert_calc_rgb_many, assert_matrix_cache_info
 
 class TestHueRotate(unittest.TestCase):
     def setup(self):
@@ -29,3 +30,10 @@ class TestHueRotate(unittest.TestCase):
         self.assertEqual(hue_rotate.calc_rgb(yellow, deg), (0, 255, 218))
         self.assertEqual(hue_rotate.calc_rgb(blue, deg), (255, 0, 37))
         self.assertEqual(hue_rotate.calc_rgb(orange, deg), (0, 232, 90))
+
+    def test_calc_rgb_many(self):
+        assert_calc_rgb_many(self, hue_rotate,
+                             list(range(-30, 391, 15)) + [400.5])
+
+    def test_matrix_cache_info(self):
+        assert_matrix_cache_info(self, hue_rotate)
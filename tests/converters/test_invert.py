@@ -1,5 +1,6 @@
 import unittest
 from color_contrast_calc.converters import invert
+from . import assert_calc_rgb_many, sample_rgbs
 
 class TestInvert(unittest.TestCase):
     def setup(self):
@@ -13,3 +14,10 @@ class TestInvert(unittest.TestCase):
         self.assertEqual(invert.calc_rgb(yellow, 0), yellow)
         self.assertEqual(invert.calc_rgb(yellow, 100), blue)
         self.assertEqual(invert.calc_rgb(yellow, 50), gray)
+
+    def test_calc_rgb_many(self):
+        assert_calc_rgb_many(self, invert, (0, 25, 50, 75, 100))
+
+        rgbs = sample_rgbs()
+        for ratio in (-1, 100.5, 150):
+            self.assertRaises(ValueError, invert.calc_rgb_many, rgbs, ratio)
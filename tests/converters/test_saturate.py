@@ -1,5 +1,6 @@
 import unittest
 from color_contrast_calc.converters import saturate
+from . import assert_calc_rgb_many, assert_matrix_cache_info
 
 class TestSaturate(unittest.TestCase):
     def setup(self):
@@ -23,3 +24,9 @@ class TestSaturate(unittest.TestCase):
 
         r = 3000
         self.assertEqual(saturate.calc_rgb(orange, r), red)
+
+    def test_calc_rgb_many(self):
+        assert_calc_rgb_many(self, saturate, list(range(0, 301, 10)) + [33.3])
+
+    def test_matrix_cache_info(self):
+        assert_matrix_cache_info(self, saturate)
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from color_contrast_calc import checker
 
 _min_contrast = 1.0
@@ -23,6 +24,20 @@ class TestChecker(unittest.TestCase):
         self.assertAlmostEqual(checker.contrast_ratio('#ffffff', yellow),
                                4.23, 2)
 
+    def test_relative_luminance(self):
+        self.assertEqual(checker.relative_luminance(_black), 0.0)
+        self.assertEqual(checker.relative_luminance(_white), 1.0)
+        self.assertEqual(checker.relative_luminance('#ff0000'), 0.2126)
+
+        # Values that are not integers from 0 to 255 are calculated
+        self.assertEqual(checker.relative_luminance((255.0, 0, 0)), 0.2126)
+        self.assertAlmostEqual(checker.relative_luminance((127.5, 0, 0)),
+                               0.2126 * ((0.5 + 0.055) / 1.055) ** 2.4)
+        self.assertAlmostEqual(checker.relative_luminance((-1, 0, 0)),
+                               0.2126 * -1 / 255 / 12.92)
+        self.assertAlmostEqual(checker.relative_luminance((382, 382, 382)),
+                               ((382 / 255 + 0.055) / 1.055) ** 2.4)
+
     def test_luminance_to_contrast_ratio(self):
         black_l = checker.relative_luminance(_black)
         white_l = checker.relative_luminance(_white)
@@ -58,3 +73,94 @@ class TestChecker(unittest.TestCase):
     def test_is_light_color(self):
         self.assertTrue(checker.is_light_color((118, 118, 118)))
         self.assertFalse(checker.is_light_color((117, 117, 117)))
+
+    def test_relative_luminance_many(self):
+        rgbs = [(r, g, b) for r in range(0, 256, 5)
+                for g in range(0, 256, 15) for b in range(0, 256, 17)]
+        expected = [checker.relative_luminance(rgb) for rgb in rgbs]
+
+        self.assertEqual(checker.relative_luminance_many(rgbs).tolist(),
+                         expected)
+
+        hex_codes = ['#ffff00', '#000', '#7F7F20']
+        expected = [checker.relative_luminance(c) for c in hex_codes]
+        self.assertEqual(checker.relative_luminance_many(hex_codes).tolist(),
+                         expected)
+
+        rgb_array = np.array([_black, _white, (127, 127, 32)], dtype=np.uint8)
+        expected = [checker.relative_luminance(tuple(int(c) for c in rgb))
+                    for rgb in rgb_array]
+        self.assertEqual(checker.relative_luminance_many(rgb_array).tolist(),
+                         expected)
+
+        self.assertEqual(checker.relative_luminance_many([]).shape, (0,))
+
+        invalid_rgbs = [[(127.9, 0, 0)], [(-1, 0, 0)], [(0, 256, 0)],
+                        np.array([_white], dtype=np.float64)]
+        for rgbs in invalid_rgbs:
+            self.assertRaises(ValueError, checker.relative_luminance_many,
+                              rgbs)
+
+        with self.assertRaises(ValueError):
+            checker.relative_luminance_many(['#ffff00', '#ff00'])
+
+    def test_tristimulus_values(self):
+        def tristimulus_value(c):
+            s = c / 255.0
+            return s / 12.92 if s <= 0.03928 else ((s + 0.055) / 1.055) ** 2.4
+
+        expected = [tristimulus_value(c) for c in range(256)]
+
+        self.assertEqual(list(checker._TRISTIMULUS_VALUES), expected)
+        self.assertEqual(checker._tristimulus_array().tolist(), expected)
+
+        for c in range(256):
+            self.assertEqual(checker.relative_luminance((c, c, c)),
+                             expected[c] * 0.2126 + expected[c] * 0.7152 +
+                             expected[c] * 0.0722)
+
+    def test_contrast_matrix(self):
+        colors = [_black, _white, (127, 127, 32), (255, 165, 0), (0, 0, 255)]
+        matrix = checker.contrast_matrix(colors)
+
+        self.assertEqual(matrix.shape, (5, 5))
+        self.assertTrue(np.array_equal(matrix, matrix.T))
+
+        for i, color1 in enumerate(colors):
+            for j, color2 in enumerate(colors):
+                self.assertEqual(matrix[i, j],
+                                 checker.contrast_ratio(color1, color2))
+
+        hex_matrix = checker.contrast_matrix(['#000', '#ffffff'])
+        self.assertEqual(hex_matrix.tolist(), [[1.0, 21.0], [21.0, 1.0]])
+
+    def test_contrast_matrix_blocks(self):
+        colors = [(r, g, 128) for r in range(0, 256, 51)
+                  for g in range(0, 256, 85)]
+        matrix = checker.contrast_matrix(colors)
+        assembled = np.zeros_like(matrix)
+
+        for rows, columns, block in checker.contrast_matrix_blocks(colors, 7):
+            self.assertLessEqual(block.size, 49)
+            assembled[rows, columns] = block
+
+        self.assertTrue(np.array_equal(assembled, matrix))
+
+    def test_ratios_to_levels(self):
+        ratios = [8, 7, 6, 4.5, 4, 3, 2.9, 1, 21]
+        codes = checker.ratios_to_levels(ratios)
+
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(codes.tolist(), [3, 3, 2, 2, 1, 1, 0, 0, 3])
+        self.assertEqual([checker.LEVELS_BY_CODE[c] for c in codes],
+                         [checker.ratio_to_level(r) for r in ratios])
+
+    def test_sufficient_mask(self):
+        ratios = np.array([8, 7, 6, 4.5, 4, 3, 2.9])
+
+        self.assertEqual(checker.sufficient_mask(ratios).tolist(),
+                         [True, True, True, True, False, False, False])
+        self.assertEqual(checker.sufficient_mask(ratios, 'AAA').tolist(),
+                         [True, True, False, False, False, False, False])
+        self.assertEqual(checker.sufficient_mask(ratios, 'A').tolist(),
+                         [True, True, True, True, True, True, False])
@@ -1,5 +1,9 @@
 import unittest
+from unittest import mock
+from color_contrast_calc import checker
+from color_contrast_calc import color
 from color_contrast_calc.color import Color
+from color_contrast_calc.converters.filter_chain import FilterChain
 from color_contrast_calc.color import NAMED_COLORS
 from color_contrast_calc.color import NAME_TO_COLOR
 from color_contrast_calc.color import HEX_TO_COLOR
@@ -79,6 +83,21 @@ class TestColor(unittest.TestCase):
         self.assertEqual(new_yellow.hex, yellow_normalized_hex)
         self.assertEqual(new_yellow.name, new_yellow_name)
 
+    def test_from_int(self):
+        yellow = Color.from_int(0xffff00)
+        self.assertIs(yellow, Color.from_name('yellow'))
+
+        new_yellow = Color.from_int(0xffff00, 'new_yellow')
+        self.assertEqual(new_yellow.rgb, (255, 255, 0))
+        self.assertEqual(new_yellow.name, 'new_yellow')
+
+        unnamed = Color.from_int(0x7bea7b)
+        self.assertEqual(unnamed.rgb, (123, 234, 123))
+        self.assertEqual(unnamed.name, '#7bea7b')
+
+        self.assertRaises(ValueError, Color.from_int, -1)
+        self.assertRaises(ValueError, Color.from_int, 0x1ffff00)
+
     def test_from_hsl(self):
         self.assertEqual(Color.from_hsl((60, 100, 50)).hex, '#ffff00')
         self.assertEqual(Color.from_hsl((60.0, 100.0, 50.0)).hex, '#ffff00')
@@ -86,6 +105,102 @@ class TestColor(unittest.TestCase):
         self.assertEqual(Color.from_hsl((30, 100, 50)).hex, '#ff8000')
         self.assertEqual(Color.from_hsl((30.0, 100.0, 50.0)).hex, '#ff8000')
 
+    def test_interning(self):
+        unnamed_rgb = (123, 234, 123)
+        unnamed_hex = '#7bea7b'
+
+        self.assertIsNone(color.interning_info())
+        self.assertIsNot(Color.from_rgb(unnamed_rgb),
+                         Color.from_rgb(unnamed_rgb))
+
+        color.enable_interning(maxsize=2)
+        self.addCleanup(color.disable_interning)
+
+        interned = Color.from_rgb(unnamed_rgb)
+        self.assertIs(Color.from_hex(unnamed_hex), interned)
+        self.assertIs(Color.from_hex('#7BEA7B'), interned)
+        self.assertIs(Color.from_hsl(interned.hsl), interned)
+        self.assertIsNot(Color.from_rgb(unnamed_rgb, 'named'), interned)
+        self.assertIs(Color.from_name('yellow'), Color.from_rgb((255, 255, 0)))
+        self.assertEqual(interned.hex, unnamed_hex)
+        self.assertEqual(interned.rgb, unnamed_rgb)
+
+        with self.assertRaises(AttributeError):
+            interned.name = 'brand'
+        with self.assertRaises(AttributeError):
+            interned.rgb = (0, 0, 0)
+        with self.assertRaises(AttributeError):
+            interned.hex = '#000000'
+        with self.assertRaises(AttributeError):
+            interned.relative_luminance = 0.0
+        self.assertEqual(interned.name, unnamed_hex)
+        self.assertEqual(Color.from_hex(unnamed_hex).rgb, unnamed_rgb)
+        unshared = Color.from_rgb(unnamed_rgb, 'named')
+        unshared.name = 'renamed'
+        self.assertEqual(unshared.name, 'renamed')
+
+        info = color.interning_info()
+        self.assertEqual((info.hits, info.misses), (4, 1))
+        self.assertEqual((info.maxsize, info.currsize), (2, 1))
+
+        Color.from_hex('#010101')
+        Color.from_hex('#020202')
+        self.assertIsNot(Color.from_rgb(unnamed_rgb), interned)
+        self.assertEqual(color.interning_info().currsize, 2)
+
+        color.disable_interning()
+        self.assertIsNone(color.interning_info())
+
+    def test_slots(self):
+        yellow = Color((255, 255, 0))
+        self.assertFalse(hasattr(yellow, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            yellow.undefined_attribute = None
+
+    def test_lazy_properties(self):
+        relative_luminance = checker.relative_luminance
+
+        with mock.patch.object(checker, 'relative_luminance',
+                               wraps=relative_luminance) as luminance:
+            orange = Color((255, 165, 0))
+            new_color = orange.with_brightness(120).with_saturate(80)
+            self.assertEqual(luminance.call_count, 0)
+
+            self.assertEqual(new_color.hex, '#f3c627')
+            self.assertEqual(new_color.name, '#f3c627')
+            self.assertEqual(luminance.call_count, 0)
+
+            self.assertEqual(new_color.relative_luminance,
+                             relative_luminance((243, 198, 39)))
+            new_color.relative_luminance
+            self.assertEqual(luminance.call_count, 1)
+
+        new_color.name = 'new_orange'
+        self.assertEqual(new_color.name, 'new_orange')
+
+    def test_set_rgb(self):
+        black = Color((0, 0, 0))
+        (black.hex, black.name, black.relative_luminance, black.hsl,
+         black.rgb_code)
+        black.rgb = (255, 255, 255)
+        self.assertEqual(black.hex, '#ffffff')
+        self.assertEqual(black.name, 'white')
+        self.assertEqual(black.relative_luminance, 1.0)
+        self.assertEqual(black.hsl, (0, 0, 100))
+        self.assertEqual(black.rgb_code, 'rgb(255,255,255)')
+
+        named = Color((0, 0, 0), 'ink')
+        named.rgb = (255, 255, 255)
+        self.assertEqual(named.name, 'ink')
+
+    def test_set_derived_attributes(self):
+        yellow = Color((255, 255, 0))
+        yellow.hex = '#ffff00'
+        yellow.relative_luminance = 0.5
+        self.assertEqual(yellow.hex, '#ffff00')
+        self.assertEqual(yellow.relative_luminance, 0.5)
+
     def test_propertyies(self):
         yellow_rgb = (255, 255, 0)
         yellow_hex = '#ffff00'
@@ -371,6 +486,20 @@ class TestColor(unittest.TestCase):
 
         self.assertEqual(orange.with_grayscale(50).rgb, (214,169, 86))
 
+    def test_with_filter(self):
+        orange = Color((255, 165, 0))
+        css_filter = 'brightness(120%) saturate(80%) hue-rotate(30deg)'
+        expected = orange.with_brightness(120).with_saturate(80)
+        expected = expected.with_hue_rotate(30)
+
+        new_color = orange.with_filter(css_filter)
+        self.assertEqual(new_color.rgb, expected.rgb)
+        self.assertEqual(new_color.name, expected.hex)
+
+        new_color = orange.with_filter(FilterChain(css_filter), 'new_color')
+        self.assertEqual(new_color.rgb, expected.rgb)
+        self.assertEqual(new_color.name, 'new_color')
+
     def test_find_brightness_threshold(self):
         yellow = Color((255, 255, 0))
         orange = Color((255, 165, 0))
@@ -409,6 +538,39 @@ class TestColor(unittest.TestCase):
         self.assertAlmostEqual(new_contrast_ratio, target_ratio, 1)
 
 
+    def test_find_brightness_threshold_with_method(self):
+        yellow = Color((255, 255, 0))
+        orange = Color((255, 165, 0))
+
+        for level in ['A', 'AA', 'AAA']:
+            target_ratio = checker.level_to_ratio(level)
+            bisection = yellow.find_brightness_threshold(orange, level)
+            analytic = yellow.find_brightness_threshold(orange, level,
+                                                        'analytic')
+            ratio = yellow.contrast_ratio_against(analytic)
+            self.assertGreaterEqual(ratio, target_ratio)
+            self.assertLessEqual(ratio,
+                                 yellow.contrast_ratio_against(bisection))
+
+        self.assertRaises(ValueError, yellow.find_brightness_threshold,
+                          orange, 'AA', 'newton')
+
+    def test_find_threshold_with_known_luminances(self):
+        orange = Color((255, 165, 0))
+        blueviolet = Color((138, 43, 226))
+        expected_brightness = orange.find_brightness_threshold(blueviolet)
+        expected_lightness = orange.find_lightness_threshold(blueviolet)
+
+        with mock.patch.object(checker, 'relative_luminance',
+                               wraps=checker.relative_luminance) as lum:
+            new_color = orange.find_brightness_threshold(blueviolet)
+            self.assertEqual(new_color.rgb, expected_brightness.rgb)
+            new_color = orange.find_lightness_threshold(blueviolet)
+            self.assertEqual(new_color.rgb, expected_lightness.rgb)
+
+            args = [call[0][0] for call in lum.call_args_list]
+            self.assertNotIn(orange.rgb, args)
+
     def test_find_lightness_threshold(self):
         yellow = Color((255, 255, 0))
         orange = Color((255, 165, 0))
@@ -70,3 +70,12 @@ class TestColorContrastCalc(unittest.TestCase):
         self.assertEqual(yellow.name, 'yellow')
         self.assertEqual(named_yellow.name, 'named_yellow')
         self.assertEqual(long_yellow.name, 'long_yellow')
+
+    def test_color_from_with_interning(self):
+        color_contrast_calc.color.enable_interning()
+        self.addCleanup(color_contrast_calc.color.disable_interning)
+
+        unnamed = color_from('#123456')
+        self.assertIs(color_from((0x12, 0x34, 0x56)), unnamed)
+        self.assertIs(color_from('#123456'), unnamed)
+        self.assertIsNot(color_from('#123456', 'named'), unnamed)
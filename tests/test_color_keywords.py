@@ -0,0 +1,29 @@
+import json
+import unittest
+from os import path
+from color_contrast_calc import utils
+from color_contrast_calc.color_keywords import COLOR_KEYWORDS
+from color_contrast_calc.color import NAMED_COLORS
+
+_json_path = path.join(path.dirname(path.abspath(utils.__file__)),
+                       'color_keywords.json')
+
+class TestColorKeywords(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def test_same_as_json(self):
+        with open(_json_path) as f:
+            color_keywords = json.loads(f.read())
+
+        self.assertEqual(len(COLOR_KEYWORDS), len(color_keywords))
+
+        for ((name, packed), (json_name, hex_code)) in zip(COLOR_KEYWORDS,
+                                                           color_keywords):
+            self.assertEqual(name, json_name)
+            self.assertEqual(utils.int_to_hex(packed), hex_code)
+
+    def test_named_colors(self):
+        self.assertEqual([(c.name, c.hex) for c in NAMED_COLORS],
+                         [(name, utils.int_to_hex(packed))
+                          for (name, packed) in COLOR_KEYWORDS])
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import unittest
+
+def _imported_modules(statement):
+    command = [sys.executable, '-X', 'importtime', '-c', statement]
+    result = subprocess.run(command, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    # Each line is "import time: self [us] | cumulative | imported package"
+    lines = [line for line in result.stderr.splitlines()
+             if line.startswith('import time:') and '|' in line]
+    return [line.rsplit('|', 1)[1].strip() for line in lines[1:]]
+
+def _imports_numpy(statement):
+    modules = _imported_modules(statement)
+    return any(m.split('.')[0] == 'numpy' for m in modules)
+
+@unittest.skipIf(sys.version_info < (3, 7), '-X importtime requires 3.7')
+class TestImportTime(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def test_import_without_numpy(self):
+        modules = _imported_modules('import color_contrast_calc')
+
+        self.assertIn('color_contrast_calc.color', modules)
+        self.assertFalse(_imports_numpy('import color_contrast_calc'))
+
+    def test_scalar_operations_without_numpy(self):
+        statement = '; '.join([
+            'from color_contrast_calc import checker, color_from',
+            'checker.contrast_ratio("#ffff00", (0, 0, 0))',
+            'yellow = color_from("yellow")',
+            'yellow.with_hue_rotate(30).with_saturate(80).with_grayscale(50)',
+            'yellow.with_filter("brightness(120%) hue-rotate(30deg)")',
+            'yellow.find_brightness_threshold(color_from("orange"))',
+            'yellow.find_lightness_threshold(color_from("orange"))',
+        ])
+
+        self.assertFalse(_imports_numpy(statement))
+
+    def test_predefined_colors_without_luminance(self):
+        statement = '; '.join([
+            'from unittest import mock',
+            'from color_contrast_calc import checker',
+            'luminance = mock.patch.object(checker, "relative_luminance")',
+            'calc = luminance.start()',
+            'from color_contrast_calc import color',
+            'assert len(color.NAMED_COLORS) == 147',
+            'assert len(color.WEB_SAFE_COLORS) == 216',
+            'assert calc.call_count == 0, calc.call_count',
+        ])
+        command = [sys.executable, '-c', statement]
+
+        self.assertEqual(subprocess.call(command), 0)
+
+    def test_batch_operations_import_numpy(self):
+        statement = '; '.join([
+            'from color_contrast_calc import checker',
+            'checker.relative_luminance_many([(255, 255, 0)])',
+        ])
+
+        self.assertTrue(_imports_numpy(statement))
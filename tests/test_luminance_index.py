@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from color_contrast_calc import checker
+from color_contrast_calc.luminance_index import LuminanceIndex
+
+class TestLuminanceIndex(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def test_relative_luminance(self):
+        index = LuminanceIndex()
+        rgbs = [(r, g, b) for r in range(0, 256, 17)
+                for g in range(0, 256, 15) for b in range(0, 256, 5)]
+
+        for rgb in rgbs:
+            self.assertEqual(index.relative_luminance(rgb),
+                             checker.relative_luminance(rgb))
+
+        self.assertEqual(index.relative_luminance('#7f7f20'),
+                         checker.relative_luminance('#7f7f20'))
+        self.assertRaises(ValueError, index.relative_luminance, (-1, 0, 0))
+        self.assertEqual(index.relative_luminance_many(rgbs).tolist(),
+                         checker.relative_luminance_many(rgbs).tolist())
+
+    def test_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'luminance.npy')
+            built = LuminanceIndex(cache_path, np.float32)
+            self.assertTrue(os.path.exists(cache_path))
+
+            loaded = LuminanceIndex(cache_path, np.float32)
+            self.assertIsInstance(loaded.luminances, np.memmap)
+            self.assertEqual(loaded.relative_luminance((255, 255, 255)), 1.0)
+            self.assertAlmostEqual(loaded.relative_luminance((127, 127, 32)),
+                                   checker.relative_luminance((127, 127, 32)),
+                                   6)
+            self.assertTrue(np.array_equal(built.luminances[::4099],
+                                           loaded.luminances[::4099]))
+
+            with self.assertRaises(ValueError):
+                LuminanceIndex(cache_path, np.float64)
+            del built, loaded
@@ -0,0 +1,165 @@
+import random
+import unittest
+from unittest import mock
+from color_contrast_calc.color import Color, NAMED_COLORS, NAME_TO_COLOR
+from color_contrast_calc import palette
+from color_contrast_calc.palette import NearestColorIndex, ContrastIndex
+
+class TestNearestColorIndex(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def brute_force(self, index, rgb):
+        point = index._to_point(rgb)
+        distances = [sum((a - b) ** 2 for (a, b) in zip(point, p))
+                     for p in index._points]
+        return distances.index(min(distances))
+
+    def test_nearest(self):
+        random.seed(19)
+        rgbs = [tuple(random.randrange(256) for _ in range(3))
+                for _ in range(2000)]
+
+        for metric in ('rgb', 'lab'):
+            index = NearestColorIndex(NAMED_COLORS, metric)
+            for rgb in rgbs:
+                expected = NAMED_COLORS[self.brute_force(index, rgb)]
+                self.assertIs(index.nearest(rgb), expected)
+
+            indexes = index.nearest_indexes(rgbs).tolist()
+            self.assertEqual([NAMED_COLORS[i] for i in indexes],
+                             [index.nearest(rgb) for rgb in rgbs])
+
+    def test_nearest_with_ties(self):
+        colors = [Color((0, 0, 0)), Color((20, 0, 0)), Color((0, 20, 0)),
+                  Color((20, 0, 0), 'copy')]
+        index = NearestColorIndex(colors)
+
+        self.assertIs(index.nearest((10, 0, 0)), colors[0])
+        self.assertIs(index.nearest((20, 0, 0)), colors[1])
+        self.assertIs(index.nearest((15, 5, 0)), colors[1])
+        self.assertEqual(index.nearest_indexes([(10, 0, 0), (20, 0, 0),
+                                                (15, 5, 0)]).tolist(),
+                         [0, 1, 1])
+
+    def test_nearest_indexes_in_chunks(self):
+        random.seed(191)
+        rgbs = [tuple(random.randrange(256) for _ in range(3))
+                for _ in range(100)]
+        index = NearestColorIndex(NAMED_COLORS)
+        expected = index.nearest_indexes(rgbs).tolist()
+
+        # Chunks of 2 query colors for 147 colors in the palette
+        with mock.patch.object(palette, '_DISTANCES_PER_CHUNK', 300):
+            self.assertEqual(index.nearest_indexes(rgbs).tolist(), expected)
+
+        with mock.patch.object(palette, '_DISTANCES_PER_CHUNK', 1):
+            self.assertEqual(index.nearest_indexes(rgbs).tolist(), expected)
+
+    def test_invalid_rgb(self):
+        for metric in ('rgb', 'lab'):
+            index = NearestColorIndex(NAMED_COLORS, metric)
+            for rgb in [(-5, 0, 0), (12.9, 0, 0), (0, 256, 0)]:
+                self.assertRaises(ValueError, index.nearest, rgb)
+                self.assertRaises(ValueError, index.nearest_indexes, [rgb])
+
+    def test_unknown_metric(self):
+        self.assertRaises(ValueError, NearestColorIndex, NAMED_COLORS, 'hsl')
+
+class TestNearestColor(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def test_nearest_color(self):
+        self.assertIs(palette.nearest_color('#fe0101'), NAME_TO_COLOR['red'])
+        self.assertIs(palette.nearest_color((250, 128, 113), metric='lab'),
+                      NAME_TO_COLOR['salmon'])
+        self.assertIs(palette.nearest_color(Color((1, 1, 1))),
+                      NAME_TO_COLOR['black'])
+
+        for color in NAMED_COLORS:
+            self.assertEqual(palette.nearest_color(color).rgb, color.rgb)
+
+    def test_nearest_color_with_palette(self):
+        brand = [Color('#003366'), Color('#ff6600'), Color('#f0f0f0')]
+
+        self.assertIs(palette.nearest_color('#224488', brand), brand[0])
+        self.assertIs(palette.nearest_color('#ffffff', brand), brand[2])
+        self.assertEqual(palette.nearest_color_indexes(
+            [(255, 80, 0), (0, 40, 90), (250, 250, 250)], brand).tolist(),
+                         [1, 0, 2])
+
+class TestContrastIndex(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def linear_scan(self, colors, background, min_ratio, max_ratio):
+        return [c for c in colors
+                if min_ratio <= c.contrast_ratio_against(background)
+                <= max_ratio]
+
+    def test_colors_with_contrast(self):
+        random.seed(20)
+        index = ContrastIndex(NAMED_COLORS)
+        ranges = [(1.0, 21.0), (4.5, 7.0), (7.0, 21.0), (1.0, 3.0),
+                  (1.0, 1.0), (21.0, 21.0), (5.0, 4.0)]
+
+        for _ in range(200):
+            background = Color(tuple(random.randrange(256)
+                                     for _ in range(3)))
+            for (min_ratio, max_ratio) in ranges:
+                expected = self.linear_scan(NAMED_COLORS, background,
+                                            min_ratio, max_ratio)
+                self.assertEqual(index.colors_with_contrast(background,
+                                                            min_ratio,
+                                                            max_ratio),
+                                 expected)
+
+    def test_colors_with_contrast_against_palette_color(self):
+        index = ContrastIndex(NAMED_COLORS)
+        black = NAME_TO_COLOR['black']
+        same = index.colors_with_contrast(black, 1.0, 1.0)
+        self.assertEqual([c.hex for c in same], ['#000000'])
+        self.assertEqual(index.colors_with_contrast('#ffffff', 21.0),
+                         [black])
+        self.assertEqual(index.colors_with_contrast((0, 0, 0), 21.0),
+                         [NAME_TO_COLOR['white']])
+
+    def test_colors_with_contrast_function(self):
+        brand = [Color('#003366'), Color('#ff6600'), Color('#f0f0f0')]
+        self.assertEqual(palette.colors_with_contrast('#ffffff', 4.5,
+                                                      palette=brand),
+                         [brand[0]])
+        self.assertEqual(palette.colors_with_contrast('#003366', 4.5, 21.0,
+                                                      brand),
+                         [brand[2]])
+        self.assertEqual(palette.colors_with_contrast('#ffffff', 1.0, 7.0),
+                         self.linear_scan(NAMED_COLORS, Color('#ffffff'),
+                                          1.0, 7.0))
+
+class TestPaletteCache(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def test_tuple_palette_by_identity(self):
+        brand = (Color('#003366'), Color('#ff6600'), Color('#f0f0f0'))
+        copied = tuple(list(brand))
+
+        index = palette._contrast_index(palette._palette_key(brand))
+        self.assertIs(palette._contrast_index(palette._palette_key(brand)),
+                      index)
+        self.assertIs(index.palette, brand)
+        self.assertIsNot(palette._contrast_index(palette._palette_key(copied)),
+                         index)
+
+        palette.nearest_color('#ffffff', brand)
+        hits = palette._nearest_color_index.cache_info().hits
+        palette.nearest_color('#000000', brand)
+        palette.nearest_color_indexes([(0, 0, 0)], brand)
+        self.assertEqual(palette._nearest_color_index.cache_info().hits,
+                         hits + 2)
+
+        # Other sequences are looked up by their contents
+        self.assertIs(palette._contrast_index(palette._palette_key(
+            list(brand))), palette._contrast_index(palette._palette_key(
+                list(brand))))
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from color_contrast_calc import utils
 
 class TestUtils(unittest.TestCase):
@@ -27,6 +28,77 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.rgb_to_hex([0, 0, 0]),
                          '#000000')
 
+    def test_hex_to_rgb_array(self):
+        codes = ['#fff', '#fa0', '#000', '#ffffff', '#FFA500', '000000',
+                 'abc', '#ff00', '#ffa50g', 'ffff00ff', '', '#', '#ff\u00e9',
+                 ' #ffa500', '#fa0 ']
+        (rgbs, valid) = utils.hex_to_rgb_array(codes)
+
+        self.assertEqual(rgbs.dtype, np.uint8)
+        self.assertEqual(rgbs.shape, (len(codes), 3))
+        self.assertEqual(valid.tolist(), [utils.is_valid_hex(c) for c in codes])
+
+        for (code, rgb, is_valid) in zip(codes, rgbs.tolist(), valid):
+            expected = utils.hex_to_rgb(code) if is_valid else (0, 0, 0)
+            self.assertEqual(tuple(rgb), expected)
+
+        (rgbs, valid) = utils.hex_to_rgb_array([])
+        self.assertEqual(rgbs.shape, (0, 3))
+        self.assertEqual(valid.shape, (0,))
+
+    def test_rgb_array_to_hex(self):
+        rgbs = [(255, 255, 255), (255, 165, 0), (0, 0, 0), (1, 2, 171)]
+
+        self.assertEqual(utils.rgb_array_to_hex(rgbs),
+                         [utils.rgb_to_hex(rgb) for rgb in rgbs])
+        self.assertEqual(utils.rgb_array_to_hex(np.array(rgbs, np.uint8)),
+                         ['#ffffff', '#ffa500', '#000000', '#0102ab'])
+        self.assertEqual(utils.rgb_array_to_hex([]), [])
+
+    def test_rgb_to_int(self):
+        self.assertEqual(utils.rgb_to_int((255, 255, 0)), 0xffff00)
+        self.assertEqual(utils.rgb_to_int((255, 165, 0)), 0xffa500)
+        self.assertEqual(utils.rgb_to_int((0, 0, 0)), 0)
+        self.assertRaises(ValueError, utils.rgb_to_int, (-1, 0, 0))
+        self.assertRaises(ValueError, utils.rgb_to_int, (0, 256, 0))
+
+    def test_int_to_rgb(self):
+        self.assertEqual(utils.int_to_rgb(0xffff00), (255, 255, 0))
+        self.assertEqual(utils.int_to_rgb(0xffa500), (255, 165, 0))
+        self.assertEqual(utils.int_to_rgb(0), (0, 0, 0))
+        self.assertRaises(ValueError, utils.int_to_rgb, -1)
+        self.assertRaises(ValueError, utils.int_to_rgb, 0x1000000)
+
+    def test_hex_to_int(self):
+        self.assertEqual(utils.hex_to_int('#ffa500'), 0xffa500)
+        self.assertEqual(utils.hex_to_int('#FFA500'), 0xffa500)
+        self.assertEqual(utils.hex_to_int('#fa0'), 0xffaa00)
+        self.assertEqual(utils.hex_to_int('ffa500'), 0xffa500)
+
+    def test_int_to_hex(self):
+        self.assertEqual(utils.int_to_hex(0xffa500), '#ffa500')
+        self.assertEqual(utils.int_to_hex(0xff), '#0000ff')
+        self.assertEqual(utils.int_to_hex(0), '#000000')
+        self.assertRaises(ValueError, utils.int_to_hex, -1)
+        self.assertRaises(ValueError, utils.int_to_hex, 0x1ffff00)
+
+    def test_rgb_array_to_int(self):
+        rgbs = [(255, 255, 0), (255, 165, 0), (0, 0, 0), (1, 2, 3)]
+        packed = utils.rgb_array_to_int(np.array(rgbs, dtype=np.uint8))
+
+        self.assertEqual(packed.dtype, np.uint32)
+        self.assertEqual(packed.tolist(), [utils.rgb_to_int(c) for c in rgbs])
+        self.assertEqual(utils.rgb_array_to_int(rgbs).tolist(),
+                         packed.tolist())
+
+    def test_int_array_to_rgb(self):
+        packed = [0xffff00, 0xffa500, 0, 0x010203]
+        rgbs = utils.int_array_to_rgb(np.array(packed, dtype=np.uint32))
+
+        self.assertEqual(rgbs.dtype, np.uint8)
+        self.assertEqual([tuple(c) for c in rgbs.tolist()],
+                         [utils.int_to_rgb(c) for c in packed])
+
     def test_normalize_hex(self):
         self.assertEqual(utils.normalize_hex('#ffa500'),
                          '#ffa500')
@@ -66,6 +138,22 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.hsl_to_rgb((240, 100, 50)),
                          (0, 0, 255))
 
+    def test_hsl_to_rgb_array(self):
+        rng = np.random.RandomState(0)
+        hsls = np.column_stack((rng.uniform(0, 360, 20000),
+                                rng.uniform(0, 100, 20000),
+                                rng.uniform(0, 100, 20000)))
+        hsls[:5000] = np.round(hsls[:5000])
+        grid = [(h, s, l) for h in range(0, 361, 15)
+                for s in range(0, 101, 10) for l in range(0, 101, 5)]
+        hsls = np.concatenate((hsls, grid))
+
+        expected = [utils.hsl_to_rgb(hsl) for hsl in hsls.tolist()]
+        rgbs = utils.hsl_to_rgb_array(hsls)
+
+        self.assertEqual(rgbs.dtype, np.uint8)
+        self.assertEqual([tuple(rgb) for rgb in rgbs.tolist()], expected)
+
     def test_hsl_to_hex(self):
         self.assertEqual(utils.hsl_to_hex([0, 100, 50]),
                          '#ff0000')
@@ -121,6 +209,22 @@ class TestUtils(unittest.TestCase):
         expected = (0, 0, 100)
         self.assertEqual(hsl, expected)
 
+    def test_rgb_to_hsl_array(self):
+        rng = np.random.RandomState(0)
+        grid = [(r, g, b) for r in range(0, 256, 15)
+                for g in range(0, 256, 15) for b in range(0, 256, 15)]
+        rgbs = np.concatenate((rng.randint(0, 256, (20000, 3)), grid))
+
+        expected = [utils.rgb_to_hsl(tuple(rgb)) for rgb in rgbs.tolist()]
+        hsls = utils.rgb_to_hsl_array(rgbs)
+
+        self.assertEqual([tuple(hsl) for hsl in hsls.tolist()], expected)
+
+        cube = np.array([(r, g, b) for r in range(0, 256, 5)
+                         for g in range(0, 256, 5) for b in range(0, 256, 5)])
+        round_trip = utils.hsl_to_rgb_array(utils.rgb_to_hsl_array(cube))
+        self.assertTrue(np.array_equal(round_trip, cube))
+
     def test_hex_to_hsl(self):
         hsl = utils.hex_to_hsl('#ff0000')
         expected = (0, 100, 50)
@@ -1,4 +1,6 @@
+import random
 import unittest
+from color_contrast_calc import checker
 from color_contrast_calc.threshold_finders import brightness
 from color_contrast_calc.color import Color
 
@@ -108,3 +110,78 @@ class TestBrightness(unittest.TestCase):
 
         color = Color((0, 180, 0))
         self.assertEqual(brightness.calc_upper_ratio_limit(color.rgb), 142)
+
+    def test_find_analytic(self):
+        random.seed(23)
+        pairs = [tuple(tuple(random.randrange(256) for _ in range(3))
+                       for _ in range(2)) for _ in range(3000)]
+        pairs += [(f, f) for (f, o) in pairs[:300]]
+        pairs += [((255, 255, 255), (0, 0, 0)), ((0, 0, 0), (0, 0, 0)),
+                  ((0, 0, 0), (255, 255, 255))]
+
+        # find_analytic() returns the passing color closest to the target,
+        # which is not always the color find() ends up with.
+        for level in ['A', 'AA', 'AAA', 15]:
+            target_ratio = checker.level_to_ratio(level)
+            for (fixed_rgb, other_rgb) in pairs:
+                bisection = brightness.find(fixed_rgb, other_rgb, level)
+                analytic = brightness.find_analytic(fixed_rgb, other_rgb,
+                                                    level)
+                bisection_ratio = checker.contrast_ratio(fixed_rgb,
+                                                         bisection)
+                analytic_ratio = checker.contrast_ratio(fixed_rgb, analytic)
+
+                if bisection_ratio >= target_ratio:
+                    self.assertGreaterEqual(analytic_ratio, target_ratio)
+                    self.assertLessEqual(analytic_ratio, bisection_ratio)
+                else:
+                    self.assertEqual(analytic, bisection)
+
+    def test_find_analytic_with_named_colors(self):
+        orange = Color.from_name('orange').rgb
+        blueviolet = Color.from_name('blueviolet').rgb
+        mintcream = Color.from_name('mintcream').rgb
+        yellow = Color.from_name('yellow').rgb
+        white = Color.from_name('white').rgb
+
+        self.assertEqual(brightness.find_analytic(orange, orange),
+                         brightness.find(orange, orange))
+        self.assertEqual(brightness.find_analytic(orange, blueviolet),
+                         brightness.find(orange, blueviolet))
+        self.assertEqual(brightness.find_analytic(yellow, mintcream, 'AAA'),
+                         white)
+
+    def test_calc_upper_ratio_limits(self):
+        rgbs = [(0, 0, 0), (255, 165, 0), (138, 43, 226), (0, 180, 0),
+                (1, 0, 0), (255, 255, 255)]
+        self.assertEqual(brightness.calc_upper_ratio_limits(rgbs).tolist(),
+                         [brightness.calc_upper_ratio_limit(rgb)
+                          for rgb in rgbs])
+
+    def test_find_many(self):
+        random.seed(21)
+        names = ['black', 'white', 'orange', 'blueviolet', 'mintcream',
+                 'yellow', 'darkgreen', 'blue', 'brown', 'fuchsia']
+        named = [Color.from_name(name).rgb for name in names]
+        fixed_rgbs = [tuple(random.randrange(256) for _ in range(3))
+                      for _ in range(500)]
+        other_rgbs = [tuple(random.randrange(256) for _ in range(3))
+                      for _ in range(500)]
+        fixed_rgbs += [f for f in named for o in named] + named
+        other_rgbs += [o for f in named for o in named] + named
+
+        for level in ['A', 'AA', 'AAA', 5.5]:
+            new_rgbs = brightness.find_many(fixed_rgbs, other_rgbs, level)
+            self.assertEqual(new_rgbs.shape, (len(fixed_rgbs), 3))
+            self.assertEqual([tuple(rgb) for rgb in new_rgbs.tolist()],
+                             [brightness.find(f, o, level) for (f, o)
+                              in zip(fixed_rgbs, other_rgbs)])
+
+    def test_find_many_with_one_fixed_color(self):
+        orange = Color.from_name('orange').rgb
+        others = [Color.from_name(name).rgb
+                  for name in ['orange', 'blueviolet', 'white', 'black']]
+        new_rgbs = brightness.find_many(orange, others)
+        self.assertEqual([tuple(rgb) for rgb in new_rgbs.tolist()],
+                         [brightness.find(orange, o) for o in others])
+        self.assertEqual(brightness.find_many([], []).shape, (0, 3))
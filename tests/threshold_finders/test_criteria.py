@@ -1,5 +1,9 @@
 import unittest
+from unittest import mock
+from color_contrast_calc import checker
 from color_contrast_calc.threshold_finders.criteria import threshold_criteria
+from color_contrast_calc.threshold_finders.criteria import (
+    BatchSearchCriteria, should_scan_darker_side, scan_darker_side_mask)
 from color_contrast_calc.color import Color
 
 class TestCriteria(unittest.TestCase):
@@ -27,3 +31,57 @@ class TestCriteria(unittest.TestCase):
         direction = threshold_criteria(target, darkgreen, darkgreen)
         self.assertTrue(direction.increment_condition(4.25))
         self.assertEqual(direction.round(4.25), 4.3)
+
+    def test_criteria_luminances(self):
+        orange = Color.from_name('orange').rgb
+        yellow = Color.from_name('yellow').rgb
+        orange_luminance = checker.relative_luminance(orange)
+        yellow_luminance = checker.relative_luminance(yellow)
+
+        with mock.patch.object(checker, 'relative_luminance',
+                               wraps=checker.relative_luminance) as lum:
+            criteria = threshold_criteria('AA', orange, yellow)
+            self.assertEqual(lum.call_count, 2)
+            self.assertEqual(criteria.fixed_luminance, orange_luminance)
+            self.assertEqual(criteria.other_luminance, yellow_luminance)
+
+            lum.reset_mock()
+            criteria = threshold_criteria('AA', orange, yellow,
+                                          orange_luminance, yellow_luminance)
+            lum.assert_not_called()
+            self.assertTrue(criteria.increment_condition(4.25))
+
+            lum.reset_mock()
+            criteria = threshold_criteria('AA', yellow, yellow,
+                                          yellow_luminance, yellow_luminance)
+            lum.assert_not_called()
+            self.assertFalse(criteria.increment_condition(4.25))
+
+    def test_batch_criteria(self):
+        target = 'AA'
+        orange = Color.from_name('orange').rgb
+        yellow = Color.from_name('yellow').rgb
+        darkgreen = Color.from_name('darkgreen').rgb
+        pairs = [(orange, yellow), (yellow, orange), (yellow, yellow),
+                 (darkgreen, darkgreen)]
+        fixed_rgbs = [f for (f, o) in pairs]
+        other_rgbs = [o for (f, o) in pairs]
+
+        criteria = BatchSearchCriteria(target, fixed_rgbs, other_rgbs)
+        self.assertEqual(criteria.increment_mask(4.25).tolist(),
+                         [True, False, False, True])
+        self.assertEqual(criteria.round(4.25).tolist(), [4.3, 4.2, 4.2, 4.3])
+        self.assertEqual(criteria.darker_side.tolist(),
+                         [should_scan_darker_side(f, o) for (f, o) in pairs])
+
+    def test_scan_darker_side_mask(self):
+        rgbs = [(0, 0, 0), (255, 255, 255), (118, 118, 118), (119, 119, 119),
+                (255, 165, 0), (0, 100, 0)]
+        fixed_rgbs = [f for f in rgbs for o in rgbs]
+        other_rgbs = [o for f in rgbs for o in rgbs]
+        mask = scan_darker_side_mask(
+            checker.relative_luminance_many(fixed_rgbs),
+            checker.relative_luminance_many(other_rgbs))
+        self.assertEqual(mask.tolist(),
+                         [should_scan_darker_side(f, o)
+                          for (f, o) in zip(fixed_rgbs, other_rgbs)])
@@ -1,3 +1,4 @@
+import random
 import unittest
 from color_contrast_calc.threshold_finders import lightness
 from color_contrast_calc.color import Color
@@ -123,3 +124,31 @@ class TestLightness(unittest.TestCase):
         new_contrast_ratio = new_color.contrast_ratio_against(green)
         self.assertTrue(new_color.is_same_color(black))
         self.assertLess(new_contrast_ratio, 6.5)
+
+    def test_find_many(self):
+        random.seed(22)
+        names = ['black', 'white', 'orange', 'blueviolet', 'mintcream',
+                 'yellow', 'darkgreen', 'blue', 'green', 'fuchsia']
+        named = [Color.from_name(name).rgb for name in names]
+        fixed_rgbs = [tuple(random.randrange(256) for _ in range(3))
+                      for _ in range(500)]
+        other_rgbs = [tuple(random.randrange(256) for _ in range(3))
+                      for _ in range(500)]
+        fixed_rgbs += [f for f in named for o in named] + named
+        other_rgbs += [o for f in named for o in named] + named
+
+        for level in ['A', 'AA', 'AAA', 6.5, 15]:
+            new_rgbs = lightness.find_many(fixed_rgbs, other_rgbs, level)
+            self.assertEqual(new_rgbs.shape, (len(fixed_rgbs), 3))
+            self.assertEqual([tuple(rgb) for rgb in new_rgbs.tolist()],
+                             [lightness.find(f, o, level) for (f, o)
+                              in zip(fixed_rgbs, other_rgbs)])
+
+    def test_find_many_with_one_fixed_color(self):
+        white = Color.from_name('white').rgb
+        others = [Color.from_name(name).rgb
+                  for name in ['green', 'orange', 'white', 'black']]
+        new_rgbs = lightness.find_many(white, others, 6.5)
+        self.assertEqual([tuple(rgb) for rgb in new_rgbs.tolist()],
+                         [lightness.find(white, o, 6.5) for o in others])
+        self.assertEqual(lightness.find_many([], []).shape, (0, 3))
@@ -0,0 +1,164 @@
+import os
+import random
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from color_contrast_calc import color
+from color_contrast_calc.color import Color
+from color_contrast_calc.threshold_finders import brightness
+from color_contrast_calc.threshold_finders import lightness
+from color_contrast_calc.threshold_finders import table
+from color_contrast_calc.threshold_finders.table import ThresholdTable
+
+class TestThresholdTable(unittest.TestCase):
+    def setup(self):
+        pass
+
+    def tearDown(self):
+        table.unregister_all()
+
+    def sample_rgbs(self):
+        random.seed(24)
+        rgbs = [(random.choice([0, 128, 255]), random.randrange(256),
+                 random.randrange(256)) for _ in range(300)]
+        return rgbs + [(0, 0, 0), (255, 255, 255)]
+
+    def test_lookup(self):
+        white = (255, 255, 255)
+        lightness_table = ThresholdTable(white, 'AA', 'lightness')
+        brightness_table = ThresholdTable(white, 'AAA', 'brightness')
+        rgbs = self.sample_rgbs()
+
+        for rgb in rgbs:
+            self.assertEqual(lightness_table.lookup(rgb),
+                             lightness.find(white, rgb, 'AA'))
+            self.assertEqual(brightness_table.lookup(rgb),
+                             brightness.find(white, rgb, 'AAA'))
+
+        self.assertEqual(lightness_table.built.nonzero()[0].tolist(),
+                         [0, 128, 255])
+        self.assertEqual([tuple(rgb) for rgb in
+                          lightness_table.lookup_many(rgbs).tolist()],
+                         [lightness_table.lookup(rgb) for rgb in rgbs])
+
+    def test_save(self):
+        orange = (255, 165, 0)
+        rgbs = self.sample_rgbs()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'orange.npz')
+            built = ThresholdTable(orange, 'AA', 'lightness', cache_path)
+            built.lookup_many(rgbs)
+            built.save()
+            self.assertTrue(os.path.exists(cache_path))
+
+            loaded = ThresholdTable(orange, 'AA', 'lightness', cache_path)
+            self.assertEqual(loaded.built.tolist(), built.built.tolist())
+
+            with mock.patch.object(lightness, 'find_many') as find_many:
+                self.assertEqual(loaded.lookup_many(rgbs).tolist(),
+                                 built.lookup_many(rgbs).tolist())
+                find_many.assert_not_called()
+
+            with self.assertRaises(ValueError):
+                ThresholdTable(orange, 'AAA', 'lightness', cache_path)
+
+        self.assertRaises(ValueError, ThresholdTable(orange).save)
+        self.assertRaises(ValueError, ThresholdTable, orange, 'AA', 'hue')
+
+    def test_register(self):
+        white = Color((255, 255, 255))
+        green = Color((0, 128, 0))
+        orange = Color((255, 165, 0))
+
+        expected = white.find_lightness_threshold(orange, 'AAA')
+        registered = table.register(white.rgb, 'AAA')
+
+        # The missing part of the table is built in the background while
+        # the search answers.
+        self.assertIsNone(table.lookup('lightness', white.rgb, orange.rgb,
+                                       7.0))
+        self.assertEqual(white.find_lightness_threshold(orange, 'AAA').rgb,
+                         expected.rgb)
+        registered.join()
+        self.assertEqual(registered.built.nonzero()[0].tolist(), [255])
+        self.assertEqual(table.lookup('lightness', white.rgb, orange.rgb, 7.0),
+                         expected.rgb)
+
+        with mock.patch.object(lightness, 'find') as find:
+            new_color = white.find_lightness_threshold(orange, 'AAA')
+            find.assert_not_called()
+        self.assertEqual(new_color.rgb, expected.rgb)
+        self.assertTrue(registered.built[255])
+
+        self.assertIsNone(table.lookup('lightness', white.rgb, orange.rgb,
+                                       'AA'))
+        self.assertIsNone(table.lookup('brightness', white.rgb, orange.rgb,
+                                       'AAA'))
+        self.assertEqual(green.find_lightness_threshold(orange, 'AAA').rgb,
+                         lightness.find(green.rgb, orange.rgb, 'AAA'))
+
+        table.unregister(white.rgb, 'AAA')
+        self.assertIsNone(table.lookup('lightness', white.rgb, orange.rgb,
+                                       'AAA'))
+
+    def test_register_brightness(self):
+        white = Color((255, 255, 255))
+        orange = Color((255, 165, 0))
+        expected = white.find_brightness_threshold(orange)
+        registered = table.register(white.rgb, 'AA', 'brightness')
+        self.assertIsNone(table.lookup('brightness', white.rgb, orange.rgb))
+        registered.join()
+
+        find = mock.Mock()
+        with mock.patch.dict(color._BRIGHTNESS_FINDERS, bisection=find):
+            new_color = white.find_brightness_threshold(orange)
+            find.assert_not_called()
+        self.assertEqual(new_color.rgb, expected.rgb)
+
+    def test_register_in_background(self):
+        white = (255, 255, 255)
+
+        with mock.patch.object(ThresholdTable, '_schedule_plane') as schedule:
+            table.register(white, background=True)
+            self.assertEqual([c[0] for c in schedule.call_args_list],
+                             [(r,) for r in range(256)])
+
+    def test_lookup_while_building(self):
+        white = (255, 255, 255)
+        registered = ThresholdTable(white)
+        started = threading.Event()
+        release = threading.Event()
+        find_many = lightness.find_many
+
+        def slow_find_many(*args):
+            started.set()
+            release.wait(5)
+            return find_many(*args)
+
+        with mock.patch.object(lightness, 'find_many', slow_find_many):
+            self.assertIsNone(registered.lookup_nowait((10, 0, 0)))
+            self.assertTrue(started.wait(5))
+            # Neither lookups nor scheduling wait for the plane being built
+            self.assertIsNone(registered.lookup_nowait((20, 0, 0)))
+            self.assertIsNone(registered.lookup_nowait((10, 0, 0)))
+            release.set()
+            registered.join()
+
+        self.assertEqual(registered.built.nonzero()[0].tolist(), [10, 20])
+
+    def test_failed_build(self):
+        white = (255, 255, 255)
+        registered = ThresholdTable(white)
+
+        with mock.patch.object(lightness, 'find_many',
+                               side_effect=MemoryError):
+            self.assertIsNone(registered.lookup_nowait((10, 0, 0)))
+            registered.join()
+
+        self.assertFalse(registered.built[10])
+        self.assertIsNone(registered.lookup_nowait((10, 0, 0)))
+        registered.join()
+        self.assertEqual(registered.lookup_nowait((10, 0, 0)),
+                         lightness.find(white, (10, 0, 0)))
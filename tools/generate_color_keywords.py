@@ -0,0 +1,44 @@
+'''Generate color_contrast_calc/color_keywords.py from
+color_contrast_calc/color_keywords.json.
+
+The JSON file remains the source of the color keywords; the generated
+module lets the table be loaded from bytecode without file I/O and
+JSON decoding at import time.  Run this script from the top directory
+of the repository after editing the JSON file:
+
+    python tools/generate_color_keywords.py
+'''
+
+import json
+from os import path
+
+
+_here = path.abspath(path.dirname(__file__))
+_package_dir = path.join(_here, '..', 'color_contrast_calc')
+
+_HEADER = """'''Color keywords defined at
+https://www.w3.org/TR/SVG/types.html#ColorKeywords
+
+This module is generated from color_keywords.json by
+tools/generate_color_keywords.py.  Do not edit it directly.
+'''
+
+# (name, RGB value packed into a 24-bit integer)
+COLOR_KEYWORDS = (
+"""
+
+
+def generate(json_path, module_path):
+    with open(json_path) as f:
+        color_keywords = json.loads(f.read())
+
+    lines = ["    ('{}', 0x{}),\n".format(name, hex_code[1:])
+             for (name, hex_code) in color_keywords]
+
+    with open(module_path, 'w') as f:
+        f.write(_HEADER + ''.join(lines) + ')\n')
+
+
+if __name__ == '__main__':
+    generate(path.join(_package_dir, 'color_keywords.json'),
+             path.join(_package_dir, 'color_keywords.py'))